@@ -1,5 +1,6 @@
 import difflib
 import re
+from contextlib import contextmanager
 from enum import Enum
 from typing import List, Optional
 
@@ -319,6 +320,20 @@ class UndoableTextContainer:
         self.set_text(txt, cursor_index)
         self._setting = False  # Unset flag
 
+    @contextmanager
+    def quiet(self):
+        """Change our widget's text without recording an undoable change.
+
+        Whatever text the widget holds afterwards becomes the new starting
+        point for undo.
+        """
+        self._setting = True
+        try:
+            yield
+        finally:
+            self._setting = False
+        self.txt = self.get_text()
+
     def set_text(self, txt, cursor_index):
         raise NotImplementedError
 
@@ -365,6 +380,20 @@ class UndoableGenericWidget:
     def get(self):
         return getattr(self.w, self.get_method)()
 
+    @contextmanager
+    def quiet(self):
+        """Change our widget without recording an undoable change.
+
+        Whatever value the widget holds afterwards becomes the new
+        starting point for undo.
+        """
+        self.im_doing_the_setting = True
+        try:
+            yield
+        finally:
+            self.im_doing_the_setting = False
+        self.last_value = self.get()
+
     def changecb(self, *args):
         if self.im_doing_the_setting:
             # If we are doing the setting, presumably this is from one
@@ -404,7 +433,14 @@ class UndoableTextView(UndoableTextContainer):
 
 
 class UndoHistoryList(list):
-    """An UndoHistoryList."""
+    """An UndoHistoryList.
+
+    Once it holds max_size actions, the oldest are forgotten as new ones
+    come in, so that a long editing session doesn't keep every action and
+    everything its callbacks refer to alive.
+    """
+
+    max_size = 10000
 
     def __init__(self, undo_widget, redo_widget, reapply_widget=None, signal="activate"):
         self.undo_widget = undo_widget
@@ -487,14 +523,13 @@ class UndoHistoryList(list):
     def gui_update(self):
         debug("gui_update", 0)
         if len(self) >= 1:
-            undoables = [x.is_undo for x in self]
-            if False in undoables:
+            if not all(x.is_undo for x in self):
                 self.set_sensitive(self.undo_widget, True)
                 debug("Sensitizing undo_widget", 0)
             else:
                 self.set_sensitive(self.undo_widget, False)
                 debug("Desensizing undo_widget", 0)
-            if True in undoables:
+            if any(x.is_undo for x in self):
                 debug("Sensitizing redo_widget", 0)
                 self.set_sensitive(self.redo_widget, True)
             else:
@@ -517,6 +552,8 @@ class UndoHistoryList(list):
     def append(self, obj):
         debug("Appending %s" % obj, 0)
         list.append(self, obj)
+        if len(self) > self.max_size:
+            del self[: len(self) - self.max_size]
         if not obj.is_undo:  # Is this necessary? Not sure...
             for h in self.action_hooks:
                 h(self, obj, "perform")
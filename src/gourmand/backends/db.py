@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import sqlalchemy
 import sqlalchemy.orm
 from gi.repository import Gtk
-from sqlalchemy import Boolean, Column, Float, ForeignKey, Integer, LargeBinary, Numeric, String, Table, Text, event, func, select
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Integer, LargeBinary, Numeric, String, Table, Text, bindparam, event, func, select
 from sqlalchemy.sql import and_, case, or_
 
 import gourmand.__version__
@@ -887,8 +887,11 @@ class RecData(Pluggable):
                 .fetchall()
             )
 
-    def get_unique_values(self, colname, table=None, **criteria):
-        """Get list of unique values for column in table."""
+    def get_unique_values(self, colname, table=None, sort=False, **criteria):
+        """Get list of unique values for column in table.
+
+        If sort is True, the database hands the values back in order.
+        """
         if table is None:
             table = self.recipe_table
         if criteria:
@@ -899,7 +902,11 @@ class RecData(Pluggable):
             print("WARNING: you are using a hack to access category values.")
             table = self.categories_table
             table = table.alias("ingrtable")
-        retval = [r[0] for r in sqlalchemy.select([getattr(table.c, colname)], distinct=True, whereclause=criteria).execute().fetchall()]
+        col = getattr(table.c, colname)
+        query = sqlalchemy.select([col], distinct=True, whereclause=criteria)
+        if sort:
+            query = query.order_by(col)
+        retval = [r[0] for r in query.execute().fetchall()]
         return [x for x in retval if x is not None]  # Don't return null values
 
     def get_ingkeys_with_count(self, search: Optional[Dict[str, Any]] = None) -> List[Tuple[int, str]]:
@@ -1194,10 +1201,8 @@ class RecData(Pluggable):
                 recdic[k] = v.strip()
 
     def modify_ings(self, ings, ingdict):
-        # allow for the possibility of doing a smarter job changing
-        # something for a whole bunch of ingredients...
-        for i in ings:
-            self.modify_ing(i, ingdict)
+        """Make the same change to a whole bunch of ingredients at once."""
+        self.do_modify_ings([(i, ingdict) for i in ings])
 
     def modify_ing_and_update_keydic(self, ing, ingdict):
         """Update our key dictionary and modify our dictionary.
@@ -1205,12 +1210,26 @@ class RecData(Pluggable):
         This is a separate method from modify_ing because we only do
         this for hand-entered data, not for mass imports.
         """
+        self.update_keydic_for_modified_ing(ing, ingdict)
+        return self.modify_ing(ing, ingdict)
+
+    def modify_ings_and_update_keydic(self, changes: List[Tuple[Any, Dict[str, Any]]]):
+        """Apply a list of (ing, ingdict) changes, as modify_ing_and_update_keydic would.
+
+        The modified rows are not fetched back from the database, so the
+        ing objects callers hold still have their old values; anything
+        that compares against them later must fetch them again.
+        """
+        for ing, ingdict in changes:
+            self.update_keydic_for_modified_ing(ing, ingdict)
+        self.do_modify_ings(changes)
+
+    def update_keydic_for_modified_ing(self, ing, ingdict):
         # If our ingredient has changed, update our keydic...
         if ing.item != ingdict.get("item", ing.item) or ing.ingkey != ingdict.get("ingkey", ing.ingkey):
             if ing.item and ing.ingkey:
                 self.remove_ing_from_keydic(ing.item, ing.ingkey)
                 self.add_ing_to_keydic(ingdict.get("item", ing.item), ingdict.get("ingkey", ing.ingkey))
-        return self.modify_ing(ing, ingdict)
 
     def update_hashes(self, rec):
         rhash, ihash = recipeIdentifier.hash_recipe(rec, self)
@@ -1424,6 +1443,20 @@ class RecData(Pluggable):
         """modify ing based on dictionary of properties and new values."""
         return self.do_modify(self.ingredients_table, ing, ingdict)
 
+    def do_modify_ings(self, changes: List[Tuple[Any, Dict[str, Any]]]):
+        """Modify many ingredients, with one executemany per set of changed columns."""
+        by_columns = {}
+        for ing, ingdict in changes:
+            # Bound parameters may not share their names with the
+            # columns being set, hence the underscores.
+            params = {"_" + k: v for k, v in ingdict.items()}
+            params["_id"] = ing.id
+            by_columns.setdefault(tuple(sorted(ingdict)), []).append(params)
+        table = self.ingredients_table
+        for columns, params in by_columns.items():
+            update = table.update().where(table.c.id == bindparam("_id")).values({c: bindparam("_" + c) for c in columns})
+            update.execute(*params)
+
     def do_modify(self, table, row, d, id_col="id"):  # sqlalchemy.sql.schema.Table  # sqlalchemy.engine.result.RowProxy  # Dict[str, Any]  # Optional[str]
         if id_col is not None:  # Saving a particular entry in the recipe
             try:
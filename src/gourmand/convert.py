@@ -285,14 +285,10 @@ class Converter:
 
     def converter(self, u1, u2, item=None, density=None):
         ## Just a front end to convert_fancy that looks up units
-        if u1 in self.unit_dict:
-            unit1 = self.unit_dict[u1]
-        else:
-            unit1 = u1
-        if u2 in self.unit_dict:
-            unit2 = self.unit_dict[u2]
-        else:
-            unit2 = u2
+        # A single get() folds each unit's case once, where "in" followed
+        # by a lookup did it twice.
+        unit1 = self.unit_dict.get(u1, u1)
+        unit2 = self.unit_dict.get(u2, u2)
         ## provide some kind of item lookup?
         return self.convert_fancy(unit1, unit2, item=item, density=density)
 
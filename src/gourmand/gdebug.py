@@ -19,11 +19,11 @@ if debug_file:
 
 
 def debug(message, level=10):
-    if timestamp:
-        ts = "%s:" % time.time()
-    else:
-        ts = ""
     if level <= debug_level:
+        if timestamp:
+            ts = "%s:" % time.time()
+        else:
+            ts = ""
         stack = traceback.extract_stack()
         if len(stack) >= 2:
             caller = stack[-2]
@@ -2,8 +2,14 @@ from gi.repository import Gtk
 
 
 def fix_action_group_importance(ag):
-    for action in ag.list_actions():
-        ifact = Gtk.IconFactory()
+    actions = ag.list_actions()
+    # The same groups get passed in over and over (on every notebook tab
+    # switch, for instance), so skip them unless actions have been added.
+    if getattr(ag, "_importance_fixed", None) == len(actions):
+        return
+    ifact = Gtk.IconFactory()
+    for action in actions:
         if not action.get_property("stock-id") or not ifact.lookup(action.get_property("stock-id")):
             # print 'No icon found for',action
             action.set_property("is-important", True)
+    ag._importance_fixed = len(actions)
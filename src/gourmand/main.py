@@ -308,6 +308,10 @@ class GourmandApplication:
         # This was stored here so that all the different comboboxes that
         # might need e.g. a list of categories can share 1 model and
         # save memory.
+        store = getattr(self, f"{attribute}Model", None)
+        if store is not None:
+            # Already built, and kept up to date by update_attribute_models
+            return store
         slist = self.create_attribute_list(attribute)
         store = Gtk.ListStore(str)
         for element in slist:
@@ -836,6 +840,8 @@ class RecGui(RecIndex, GourmandApplication, ImporterExporter, StuffThatShouldBeP
         self.ui_manager.add_ui_from_string(ui_string)
 
         self.doing_multiple_deletions = False
+        self._post_save_recipes = {}  # recipe id -> latest saved row
+        self._post_save_idle_id = 0
         GourmandApplication.__init__(self)
         self.setup_index_columns()
         self.setup_hacks()
@@ -1109,6 +1115,25 @@ class RecGui(RecIndex, GourmandApplication, ImporterExporter, StuffThatShouldBeP
     def redo_search(self, *args):
         return RecIndex.redo_search(self, *args)
 
+    def queue_post_save_refresh(self, recipe):
+        """Refresh the index and the Go menu after a recipe is saved.
+
+        The refresh happens once the main loop is idle, so that saving
+        several recipes in a row only rebuilds the index once.
+        """
+        self._post_save_recipes[recipe.id] = recipe
+        if not self._post_save_idle_id:
+            self._post_save_idle_id = GLib.idle_add(self._post_save_refresh, priority=GLib.PRIORITY_LOW)
+
+    def _post_save_refresh(self):
+        self._post_save_idle_id = 0
+        recipes, self._post_save_recipes = self._post_save_recipes, {}
+        for recipe in recipes.values():
+            self.rmodel.update_recipe(recipe)
+        self.update_go_menu()
+        self.redo_search()  # Trigger a refresh of the recipe tree
+        return False
+
     def rec_tree_select_rec(self, *args):
         debug("rec_tree_select_rec (self, *args):", 5)
         for rec in self.get_selected_recs_from_rec_tree():
@@ -251,6 +251,7 @@ class IngredientKeyEditor(RecEditorModule):
                         ingkey = self.rg.rd.km.get_key(item.split(";")[0], 1.0)
                     self.model.append((row[0], item, ingkey))
 
+            ie.ingtree_ui.ingController.finish_loading()
             for row in ie.ingtree_ui.ingController.imodel:
                 process_row(row)
 
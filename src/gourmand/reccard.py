@@ -1,7 +1,11 @@
-import gc
 import webbrowser
-import xml.sax.saxutils
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from pkgutil import get_data
+from threading import Thread
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from gi.repository import Gdk, GdkPixbuf, GLib, GObject, Gtk, Pango
@@ -12,7 +16,7 @@ from gourmand import image_utils as iu
 from gourmand.exporters.clipboard_exporter import copy_to_clipboard
 from gourmand.exporters.exportManager import ExportManager
 from gourmand.exporters.printer import PrintManager
-from gourmand.gdebug import debug
+from gourmand.gdebug import debug, debug_level
 from gourmand.gglobals import FLOAT_REC_ATTRS, INT_REC_ATTRS, REC_ATTR_DIC, REC_ATTRS
 from gourmand.gtk_extras import WidgetSaver, fix_action_group_importance, mnemonic_manager, ratingWidget, validation  # noqa: F401
 from gourmand.gtk_extras import cb_extras as cb
@@ -26,16 +30,85 @@ from gourmand.plugin import IngredientControllerPlugin, RecDisplayPlugin, RecEdi
 from gourmand.recindex import RecIndex
 
 
+@lru_cache(maxsize=None)
+def _load_ui_xml(filename: str) -> str:
+    """Return the decoded contents of a packaged .ui file.
+
+    The files never change while we run, so there is no reason to read and
+    decode them again every time a recipe card is opened.
+    """
+    return get_data("gourmand", f"ui/{filename}").decode()
+
+
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _escape(text: str) -> str:
+    """Escape &, < and > for Pango markup, in a single pass over text."""
+    return text.translate(_ESCAPE_TABLE)
+
+
+def _partition_rec_attrs() -> Tuple[List[str], List[str]]:
+    """Split REC_ATTRS into attributes edited with Entries and with Combos."""
+    entries, combos = [], []
+    for attribute, label, widget_type in REC_ATTRS:
+        if widget_type == "Entry":
+            entries.append(attribute)
+        elif widget_type == "Combo":
+            combos.append(attribute)
+        else:
+            raise ValueError(f"{attribute} with {widget_type} not supported")
+    return entries, combos
+
+
+_ENTRY_REC_ATTRS, _COMBO_REC_ATTRS = _partition_rec_attrs()
+_NUMERIC_REC_ATTRS = frozenset(INT_REC_ATTRS + FLOAT_REC_ATTRS)
+
+# Ingredient attributes that need not be written back when unchanged.
+_COMPARED_ING_ATTRS = ("amount", "unit", "item", "ingkey", "position", "inggroup", "optional")
+_get_compared_ing_attrs = attrgetter(*_COMPARED_ING_ATTRS)
+
+
+@lru_cache(maxsize=512)
+def get_pluralized_form(word: Optional[str], n: float) -> str:
+    """Memoized defaults.get_pluralized_form, used while spinning yields."""
+    return defaults.defaults.get_pluralized_form(word, n)
+
+
+@lru_cache(maxsize=512)
+def float_to_frac(n: float, use_fractions: int) -> str:
+    """Memoized convert.float_to_frac.
+
+    The result depends on convert.USE_FRACTIONS, which can be changed in the
+    preferences, so it has to be passed in as part of the cache key.
+    """
+    return convert.float_to_frac(n)
+
+
+def make_action_group(name: str, actions: List[tuple], owner: Any) -> Gtk.ActionGroup:
+    """Create an action group from a table of action entries.
+
+    The tables are shared class attributes, so callbacks are given as the
+    names of methods of owner rather than as bound methods.
+    """
+    group = Gtk.ActionGroup(name=name)
+    group.add_actions([entry[:5] + (getattr(owner, entry[5]),) if len(entry) > 5 else entry for entry in actions])
+    return group
+
+
 def find_entry(widget) -> Optional[Gtk.Entry]:
-    """Recurse through all the children widgets to find the first Gtk.Entry."""
-    if isinstance(widget, Gtk.Entry):
-        return widget
-    if not hasattr(widget, "get_children"):
-        return
-    for child in widget.get_children():
-        e = find_entry(child)
-        if e is not None:
-            return e
+    """Walk through all the children widgets to find the first Gtk.Entry."""
+    pending = deque((widget,))
+    while pending:
+        widget = pending.popleft()
+        if isinstance(widget, Gtk.Entry):
+            return widget
+        get_children = getattr(widget, "get_children", None)
+        if get_children is not None:
+            # Put the children in front, so that we keep visiting the tree
+            # in the same order as a recursive walk would.
+            pending.extendleft(reversed(get_children()))
+    return None
 
 
 class RecRef:
@@ -56,6 +129,7 @@ class RecCard:
         self.__rec_display: Optional[RecCardDisplay] = None
         self.__new: bool = recipe is None
         self.__current_rec = recipe or rec_gui.rd.new_rec()  # recipe is RowProxy
+        self.__ings_cache: Dict[int, List[Any]] = {}  # recipe id -> ingredients
 
         self.conf = []  # This list is unused, and should be refactored out
 
@@ -109,7 +183,19 @@ class RecCard:
     def delete(self, *args) -> None:
         self.__rec_gui.rec_tree_delete_recs([self.current_rec])
 
+    def get_ings(self) -> List[Any]:
+        """Return the ingredients of the current recipe.
+
+        They are fetched from the database once, and kept until the recipe
+        is updated.
+        """
+        rec_id = self.current_rec.id
+        if rec_id not in self.__ings_cache:
+            self.__ings_cache[rec_id] = self.__rec_gui.rd.get_ings(self.current_rec)
+        return self.__ings_cache[rec_id]
+
     def update_recipe(self, recipe) -> None:  # recipe is RowProxy
+        self.__ings_cache.clear()
         self.current_rec = recipe
         if self.__rec_display is not None:
             self.__rec_display.update_from_database()
@@ -164,6 +250,7 @@ class RecCardDisplay(plugin_loader.Pluggable):
         </menubar>
     </ui>
     """
+    IMAGE_WIDTH_STEP = 16  # pixels
     __display_items = [
         "title",
         "rating",
@@ -178,6 +265,8 @@ class RecCardDisplay(plugin_loader.Pluggable):
         "instructions",
         "modifications",
     ]
+    # (attribute, display widget name, display label widget name)
+    __display_widget_names = [(attr, f"{attr}Display", f"{attr}DisplayLabel") for attr in __display_items]
 
     def __init__(self, reccard, recGui, recipe=None):
         self.reccard = reccard
@@ -186,27 +275,50 @@ class RecCardDisplay(plugin_loader.Pluggable):
         self.mult = 1  # parameter
         self.conf: List[Gtk.Widget] = []
         self.prefs = prefs.Prefs.instance()
+        self._reflow_idle_id = 0
+        self._display_ingredients_id = 0
+        self._scaled_pixbuf: Tuple[Optional[int], Optional[GdkPixbuf.Pixbuf]] = (None, None)
+        self._image_generation = 0
+        self._displayed_text: Dict[str, str] = {}
         self.setup_ui()
         self.setup_uimanager()
         self.setup_main_window()
 
         self._last_module = None
         self.left_notebook.connect("switch-page", lambda *args: GLib.idle_add(self.left_notebook_change_cb))
-        self.left_notebook_pages = {0: self}
 
         self.ingredientDisplay = IngredientDisplay(self)
         self.modules = [self.ingredientDisplay]
         self.update_from_database()
-        plugin_loader.Pluggable.__init__(self, [ToolPlugin, RecDisplayPlugin])
-        self.mm = mnemonic_manager.MnemonicManager()
-        self.mm.add_toplevel_widget(self.window)
-        self.mm.fix_conflicts_peacefully()
+        # Plugins get activated (and add their pages) while we register as
+        # pluggable: only lay out the notebook once they are all in.
+        self._loading_plugins = True
+        self.left_notebook.freeze_child_notify()
+        try:
+            plugin_loader.Pluggable.__init__(self, [ToolPlugin, RecDisplayPlugin])
+        finally:
+            self.left_notebook.thaw_child_notify()
+            self._loading_plugins = False
+        self.update_left_notebook_tabs()
+        # Only now show the window, so that the widgets for attributes this
+        # recipe doesn't have were hidden before ever being realized.
+        self.window.show()
+        # Walking the whole window for mnemonics can wait until the card
+        # has been drawn.
+        GLib.idle_add(self.fix_mnemonics, priority=GLib.PRIORITY_LOW)
+
+    def fix_mnemonics(self) -> bool:
+        if self.window.get_realized():
+            self.mm = mnemonic_manager.MnemonicManager()
+            self.mm.add_toplevel_widget(self.window)
+            self.mm.fix_conflicts_peacefully()
+        return False
 
     def setup_uimanager(self):
         self.ui_manager = Gtk.UIManager()
         self.ui_manager.add_ui_from_string(self.ui_string)
         self.setup_actions()
-        for group in [self.recipeDisplayActionGroup, self.rg.toolActionGroup, self.rg.toolActionGroup]:
+        for group in [self.recipeDisplayActionGroup, self.rg.toolActionGroup]:
             fix_action_group_importance(group)
         self.ui_manager.insert_action_group(self.recipeDisplayActionGroup, 0)
         self.ui_manager.insert_action_group(self.recipeDisplayFuturePluginActionGroup, 0)
@@ -260,7 +372,7 @@ class RecCardDisplay(plugin_loader.Pluggable):
 
     def setup_ui(self):
         self.ui = Gtk.Builder()
-        self.ui.add_from_string(get_data("gourmand", "ui/recCardDisplay.ui").decode())
+        self.ui.add_from_string(_load_ui_xml("recCardDisplay.ui"))
 
         self.ui.connect_signals(
             {
@@ -274,17 +386,19 @@ class RecCardDisplay(plugin_loader.Pluggable):
         self.setup_widgets_from_ui()
 
     def setup_widgets_from_ui(self):
-        for attr in self.__display_items:
-            setattr(self, "%sDisplay" % attr, self.ui.get_object("%sDisplay" % attr))
-            setattr(self, "%sDisplayLabel" % attr, self.ui.get_object("%sDisplayLabel" % attr))
+        for attr, display_name, label_name in self.__display_widget_names:
+            display = self.ui.get_object(display_name)
+            label = self.ui.get_object(label_name)
+            setattr(self, display_name, display)
+            setattr(self, label_name, label)
             try:
-                assert getattr(self, "%sDisplay" % attr)
+                assert display
                 if attr not in ["title", "yield_unit"]:
-                    assert getattr(self, "%sDisplayLabel" % attr)
+                    assert label
             except:
                 print("Failed to load all widgets for ", attr)
-                print("%sDisplay" % attr, "->", getattr(self, "%sDisplay" % attr))
-                print("%sDisplayLabel" % attr, "->", getattr(self, "%sDisplayLabel" % attr))
+                print(display_name, "->", display)
+                print(label_name, "->", label)
                 raise
         # instructions & notes display
         for d in ["instructionsDisplay", "modificationsDisplay"]:
@@ -304,53 +418,57 @@ class RecCardDisplay(plugin_loader.Pluggable):
         self.multiplyDisplayLabel = self.ui.get_object("multiplyByDisplayLabel")
         # Image display widget
         self.imageDisplay = self.ui.get_object("imageDisplay")
+        # Bind each displayed attribute to the function updating its widgets
+        self.display_updaters = [
+            self.make_display_updater(attr, getattr(self, display_name), getattr(self, label_name))
+            for attr, display_name, label_name in self.__display_widget_names
+        ]
         # end setup_widgets_from_ui
         self.reflow_on_resize = [
-            (getattr(self, "%sDisplay" % s[0]), s[1])
-            for s in [
-                ("title", 0.9),  # label and percentage of screen it can take up...
-                ("cuisine", 0.5),
-                ("category", 0.5),
-                ("source", 0.5),
-            ]
+            (self.titleDisplay, 0.9),  # label and percentage of screen it can take up...
+            (self.cuisineDisplay, 0.5),
+            (self.categoryDisplay, 0.5),
+            (self.sourceDisplay, 0.5),
         ]
         sw = self.ui.get_object("recipeBodyDisplay")
         sw.connect("size-allocate", self.reflow_on_allocate_cb)
         sw.set_redraw_on_allocate(True)
 
     def reflow_on_allocate_cb(self, sw, allocation):
+        # size-allocate is emitted over and over while the window is being
+        # resized: only reflow once things have settled down.
+        if not self._reflow_idle_id:
+            self._reflow_idle_id = GLib.idle_add(self.reflow, sw, priority=GLib.PRIORITY_LOW)
+
+    def reflow(self, sw) -> bool:
+        self._reflow_idle_id = 0
         hadj = sw.get_hadjustment()
         xsize = hadj.get_page_size()
         for widget, perc in self.reflow_on_resize:
             widg_width = int(xsize * perc)
-            widget.set_size_request(widg_width, -1)
-            t = widget.get_label()
-            widget.set_label(t)
-        # Flow our image...
-        image_width = int(xsize * 0.75)
-        if not hasattr(self, "orig_pixbuf") or not self.orig_pixbuf:
-            return
-        pb = self.imageDisplay.get_pixbuf()
-        iwidth = pb.get_width()
+            # Changing the size request is enough for the label to rewrap.
+            if widget.get_size_request()[0] != widg_width:
+                widget.set_size_request(widg_width, -1)
+        # Flow our image, in steps of a few pixels so that we don't resample
+        # it for every single pixel the window grows or shrinks by.
+        image_width = int(xsize * 0.75) // self.IMAGE_WIDTH_STEP * self.IMAGE_WIDTH_STEP
+        if not hasattr(self, "orig_pixbuf") or not self.orig_pixbuf or not image_width:
+            return False
+        iwidth = self.imageDisplay.get_pixbuf().get_width()
         origwidth = self.orig_pixbuf.get_width()
-        new_pb = None
-        if iwidth > image_width:
-            scale = float(image_width) / iwidth
-            width = iwidth * scale
-            height = pb.get_height() * scale
-            new_pb = self.orig_pixbuf.scale_simple(int(width), int(height), GdkPixbuf.InterpType.BILINEAR)
-        elif (origwidth > iwidth) and (image_width > iwidth):
-            if image_width < origwidth:
-                scale = float(image_width) / origwidth
-                width = image_width
-                height = self.orig_pixbuf.get_height() * scale
-                new_pb = self.orig_pixbuf.scale_simple(int(width), int(height), GdkPixbuf.InterpType.BILINEAR)
-            else:
+        width = min(image_width, origwidth)
+        if width == iwidth:
+            return False
+        cached_width, new_pb = self._scaled_pixbuf
+        if cached_width != width:
+            if width == origwidth:
                 new_pb = self.orig_pixbuf
-        if new_pb:
-            del pb
-            self.imageDisplay.set_from_pixbuf(new_pb)
-        gc.collect()
+            else:
+                height = self.orig_pixbuf.get_height() * float(width) / origwidth
+                new_pb = self.orig_pixbuf.scale_simple(width, max(int(height), 1), GdkPixbuf.InterpType.BILINEAR)
+            self._scaled_pixbuf = (width, new_pb)
+        self.imageDisplay.set_from_pixbuf(new_pb)
+        return False
 
     # Main GUI setup
     def setup_main_window(self):
@@ -374,11 +492,10 @@ class RecCardDisplay(plugin_loader.Pluggable):
         # Main has a series of important boxes which we will add our interfaces to...
         self.left_notebook = self.ui.get_object("recipeDisplayLeftNotebook")
         self.window.add_accel_group(self.ui_manager.get_accel_group())
-        self.window.show()
 
     def shop_for_recipe_cb(self, *args):
         try:
-            d = self.rg.sl.getOptionalIngDic(self.rg.rd.get_ings(self.current_rec), self.mult, self.prefs)
+            d = self.rg.sl.getOptionalIngDic(self.reccard.get_ings(), self.mult, self.prefs)
         except UserCancelledError:
             return
         self.rg.sl.addRec(self.current_rec, self.mult, d)
@@ -388,27 +505,39 @@ class RecCardDisplay(plugin_loader.Pluggable):
         instance = klass(self)
         tab_label = Gtk.Label()
         tab_label.set_label(instance.label)
-        n = self.left_notebook.append_page(instance.main, tab_label=tab_label)
-        self.left_notebook_pages[n] = instance
+        self.left_notebook.append_page(instance.main, tab_label=tab_label)
+        # Let the notebook page tell us which module it belongs to
+        instance.main.display_module = instance
         instance.main.show()
         tab_label.show()
         self.modules.append(instance)
-        self.left_notebook.set_show_tabs(self.left_notebook.get_n_pages() > 1)
+        if not self._loading_plugins:
+            self.update_left_notebook_tabs()
 
     def remove_plugin_from_left_notebook(self, klass):
-        for mod in self.modules[:]:
-            if isinstance(mod, klass):
-                self.modules.remove(mod)
-                page_num = self.left_notebook.page_num(mod.main)
-                self.left_notebook.remove_page(page_num)
-                del self.left_notebook_pages[page_num]
-                del mod.main
-                del mod
+        self.left_notebook.freeze_child_notify()
+        try:
+            for mod in self.modules[:]:
+                if isinstance(mod, klass):
+                    self.modules.remove(mod)
+                    self.left_notebook.remove_page(self.left_notebook.page_num(mod.main))
+                    del mod.main
+                    del mod
+        finally:
+            self.left_notebook.thaw_child_notify()
+        self.update_left_notebook_tabs()
+
+    def update_left_notebook_tabs(self):
+        """Only show tabs if plugins added pages next to our own."""
         self.left_notebook.set_show_tabs(self.left_notebook.get_n_pages() > 1)
 
     def left_notebook_change_cb(self):
         page = self.left_notebook.get_current_page()
-        module = self.left_notebook_pages.get(page, None)
+        if page < 0:
+            module = None
+        else:
+            # The first page is our own; the others were added by plugins
+            module = getattr(self.left_notebook.get_nth_page(page), "display_module", self)
         if self._last_module and self._last_module != module and hasattr(self._last_module, "leave_page"):
             self._last_module.leave_page()
         if module:
@@ -417,65 +546,127 @@ class RecCardDisplay(plugin_loader.Pluggable):
             self._last_module = module
 
     def update_from_database(self):
-        for module in self.modules:
-            # Protect ourselves from bad modules, since these could be
-            # plugins
-            try:
-                module.update_from_database()
-            except Exception:
-                print("WARNING: Exception raised by %(module)s.update_from_database()" % locals())
-                import traceback
-
-                traceback.print_exc()
-
-        self.update_image()
-
+        # Hold back notifications until all the widgets have been updated,
+        # rather than having each change ripple through the window.
+        self.window.freeze_child_notify()
+        try:
+            for module in self.modules:
+                # Protect ourselves from bad modules, since these could be
+                # plugins
+                try:
+                    module.update_from_database()
+                except Exception:
+                    print("WARNING: Exception raised by %(module)s.update_from_database()" % locals())
+                    import traceback
+
+                    traceback.print_exc()
+
+            self.update_image()
+
+            shown: List[Gtk.Widget] = []
+            hidden: List[Gtk.Widget] = []
+            for updater in self.display_updaters:
+                updater(shown, hidden)
+            for widget in hidden:
+                widget.hide()
+            for widget in shown:
+                widget.show()
+        finally:
+            self.window.thaw_child_notify()
+
+    def make_display_updater(self, attr: str, widg: Gtk.Widget, widgLab: Optional[Gtk.Widget]) -> Callable[[List[Gtk.Widget], List[Gtk.Widget]], None]:
+        """Return a function refreshing the widgets displaying attr.
+
+        The function is handed two lists, to which it adds the widgets to be
+        shown or hidden once every attribute has been updated.
+        """
         special_display_functions = {
             "yields": self.update_yields_display,
             "yield_unit": self.update_yield_unit_display,
             "title": self.update_title_display,
             "link": self.update_link_display,
         }
-        for attr in self.__display_items:
-            if attr in special_display_functions:
-                special_display_functions[attr]()
+        if attr in special_display_functions:
+            display_function = special_display_functions[attr]
+            return lambda shown, hidden: display_function()
+
+        if attr == "category":
+
+            def get_value():
+                return ", ".join(self.rg.rd.get_cats(self.current_rec))
+
+        else:
+
+            def get_value():
+                return getattr(self.current_rec, attr)
+
+        if attr == "rating":
+            set_value = widg.set_value
+        elif attr in ["preptime", "cooktime"]:
+
+            def set_value(val):
+                widg.set_text(convert.seconds_to_timestring(val))
+
+        elif attr in ["instructions", "modifications"]:
+            # Setting these parses markup and time links in the whole text:
+            # leave the buffer alone if the text hasn't changed.
+            def set_value(val):
+                if self._displayed_text.get(attr) == val:
+                    return
+                buf = widg.get_buffer()
+                buf.begin_user_action()
+                widg.set_text(val)
+                buf.end_user_action()
+                self._displayed_text[attr] = val
+
+        else:
+            set_value = widg.set_text
+
+        def update(shown, hidden):
+            attval = get_value()
+            if attval:
+                debug("showing attribute %s = %s" % (attr, attval), 0)
+                set_value(attval)
+                shown.extend((widg, widgLab))
             else:
-                widg = getattr(self, "%sDisplay" % attr)
-                widgLab = getattr(self, "%sDisplayLabel" % attr)
-                if not widg or not widgLab:
-                    raise Exception("There is no widget or label for  %s=%s, %s=%s" % (attr, widg, "label", widgLab))
-                if attr == "category":
-                    attval = ", ".join(self.rg.rd.get_cats(self.current_rec))
-                else:
-                    attval = getattr(self.current_rec, attr)
-                if attval:
-                    debug("showing attribute %s = %s" % (attr, attval), 0)
-                    if attr == "rating":
-                        widg.set_value(attval)
-                    elif attr in ["preptime", "cooktime"]:
-                        widg.set_text(convert.seconds_to_timestring(attval))
-                    else:
-                        widg.set_text(attval)
-                        # if attr in ['modifications',#'instructions'
-                        #            ]:
-                        #    widg.set_use_markup(True)
-                        #    widg.set_size_request(600,-1)
-                    widg.show()
-                    widgLab.show()
-                else:
-                    debug("hiding attribute %s" % attr, 0)
-                    widg.hide()
-                    widgLab.hide()
+                debug("hiding attribute %s" % attr, 0)
+                hidden.extend((widg, widgLab))
+
+        return update
 
     def update_image(self):
         imagestring = self.current_rec.image
-        if imagestring is None:
-            self.orig_pixbuf = None
+        self._scaled_pixbuf = (None, None)
+        self.orig_pixbuf = None
+        # Tell any decoding still running for a previous image to give up.
+        self._image_generation += 1
+        # Don't leave the previous recipe's picture up while we decode.
+        self.imageDisplay.clear()
+        self.imageDisplay.hide()
+        if imagestring is not None:
+            # Decoding large images takes a while: don't block the card
+            # from showing up while it is done.
+            Thread(target=self._decode_image, args=(imagestring, self._image_generation), daemon=True).start()
+
+    def _decode_image(self, imagestring: bytes, generation: int):
+        try:
+            pixbuf = iu.bytes_to_pixbuf(imagestring)
+        except GLib.Error as e:
+            debug("Unable to decode recipe image: %s" % e, 0)
+            pixbuf = None
+        GLib.idle_add(self._install_image, pixbuf, generation)
+
+    def _install_image(self, pixbuf: Optional[GdkPixbuf.Pixbuf], generation: int) -> bool:
+        if generation != self._image_generation:
+            return False
+        if pixbuf is None:
+            # The image could not be decoded.
             self.imageDisplay.hide()
         else:
-            self.orig_pixbuf = iu.bytes_to_pixbuf(imagestring)
-            self.imageDisplay.set_from_pixbuf(self.orig_pixbuf)
+            self.orig_pixbuf = pixbuf
+            self.imageDisplay.set_from_pixbuf(pixbuf)
             self.imageDisplay.show()
+        return False
 
     def update_yield_unit_display(self):
         self.yield_unitDisplay.set_text(self.current_rec.yield_unit or "")
@@ -509,7 +700,7 @@ class RecCardDisplay(plugin_loader.Pluggable):
         title = self.current_rec.title
         title = title if title is not None else "Untitled"
         self.window.set_title(title)
-        title = "<b><big>" + xml.sax.saxutils.escape(title) + "</big></b>"
+        title = "<b><big>" + _escape(title) + "</big></b>"
         self.titleDisplay.set_label(title)
 
     def update_link_display(self):
@@ -526,12 +717,11 @@ class RecCardDisplay(plugin_loader.Pluggable):
             self.offer_url(_("Recipe successfully exported to " '<a href="file:///%s">%s</a>') % (fn, fn), url="file:///%s" % fn)
 
     def toggle_readable_units_cb(self, widget):
-        if widget.get_active():
-            self.prefs["readableUnits"] = True
-            self.ingredientDisplay.display_ingredients()
-        else:
-            self.prefs["readableUnits"] = False
-            self.ingredientDisplay.display_ingredients()
+        active = widget.get_active()
+        if self.prefs.get("readableUnits", True) == active:
+            return
+        self.prefs["readableUnits"] = active
+        self.ingredientDisplay.display_ingredients()
 
     def preferences_cb(self, *args):
         self.rg.prefsGui.show_dialog(page=self.rg.prefsGui.CARD_PAGE)
@@ -550,7 +740,7 @@ class RecCardDisplay(plugin_loader.Pluggable):
             elif do_save is None:  # Gtk.ResponseType.CANCEL
                 return
 
-        ingredients = self.rg.rd.get_ings(self.current_rec.id)
+        ingredients = self.reccard.get_ings()
         # The exporter can do several recipes at once, hence the list of tuples.
         copy_to_clipboard([(self.current_rec, ingredients)])
 
@@ -567,11 +757,21 @@ class RecCardDisplay(plugin_loader.Pluggable):
 
     def yields_change_cb(self, widg):
         self.update_yields_multiplier(widg.get_value())
-        self.ingredientDisplay.display_ingredients()  # re-update
+        self.queue_display_ingredients()  # re-update
 
     def multiplication_change_cb(self, widg):
         self.mult = widg.get_value()
-        self.ingredientDisplay.display_ingredients()  # re-update
+        self.queue_display_ingredients()  # re-update
+
+    def queue_display_ingredients(self):
+        """Redisplay the ingredients once the spin buttons stop changing."""
+        if not self._display_ingredients_id:
+            self._display_ingredients_id = GLib.timeout_add(30, self._display_ingredients)
+
+    def _display_ingredients(self) -> bool:
+        self._display_ingredients_id = 0
+        self.ingredientDisplay.display_ingredients()
+        return False
 
     def update_yields_multiplier(self, val):
         yields = self.yieldsDisplaySpin.get_value()
@@ -579,7 +779,7 @@ class RecCardDisplay(plugin_loader.Pluggable):
             self.yield_unitDisplay.set_text(self.current_rec.yield_unit)
         if yields != self.current_rec.yields:
             # Consider pluralizing...
-            plur_form = defaults.defaults.get_pluralized_form(self.current_rec.yield_unit, yields)
+            plur_form = get_pluralized_form(self.current_rec.yield_unit, yields)
             if plur_form != self.yield_unitDisplay.get_text():
                 # Change text!
                 self.yield_unitDisplay.set_text(plur_form)
@@ -588,7 +788,7 @@ class RecCardDisplay(plugin_loader.Pluggable):
         else:
             self.mult = 1
         if self.mult != 1:
-            self.yieldsMultiplyByLabel.set_text("x %s" % convert.float_to_frac(self.mult))
+            self.yieldsMultiplyByLabel.set_text("x %s" % float_to_frac(self.mult, convert.USE_FRACTIONS))
         else:
             self.yieldsMultiplyByLabel.set_label("")
 
@@ -623,6 +823,8 @@ class IngredientDisplay:
         self.setup_widgets()
         self.rg = self.recipe_display.rg
         self.markup_ingredient_hooks = []
+        # (id(ingredient), multiplier, readable units) -> (amount, unit)
+        self._amount_cache: Dict[Tuple[int, float, bool], Tuple[str, str]] = {}
 
     def setup_widgets(self):
         self.ui = self.recipe_display.ui
@@ -632,39 +834,46 @@ class IngredientDisplay:
         self.ingredientsDisplay.set_wrap_mode(Gtk.WrapMode.WORD)
 
     def update_from_database(self):
-        self.ing_alist = self.rg.rd.order_ings(self.rg.rd.get_ings(self.recipe_display.current_rec))
+        self.ing_alist = self.rg.rd.order_ings(self.recipe_display.reccard.get_ings())
+        self._amount_cache.clear()
         self.display_ingredients()
 
+    def get_amount_and_unit(self, ing, mult: float, conv) -> Tuple[str, str]:
+        """Return the formatted amount and unit of an ingredient.
+
+        Changing the yields or multiplier redisplays every ingredient, so we
+        remember the results until the ingredients are reloaded.
+        """
+        key = (id(ing), mult, conv is not None)
+        if key not in self._amount_cache:
+            self._amount_cache[key] = self.rg.rd.get_amount_and_unit(ing, mult=mult, conv=conv)
+        return self._amount_cache[key]
+
     def display_ingredients(self):
+        escape = _escape
+        get_amount_and_unit = self.get_amount_and_unit
+        # Most of the time no plugin has registered a markup hook.
+        if not self.markup_ingredient_hooks:
+            run_hooks = None
+        elif len(self.markup_ingredient_hooks) == 1:
+            run_hooks = self.markup_ingredient_hooks[0]
+        else:
+            run_hooks = self.run_markup_ingredient_hooks
+        mult = self.recipe_display.mult
+        conv = self.prefs.get("readableUnits", True) and self.rg.conv or None
+        optional = _("(Optional)")
         group_strings = []
-        group_index = 0
-        for group, ings in self.ing_alist:
-            labels = []
-            if group:
-                labels.append(f"<u>{xml.sax.saxutils.escape(group)}</u>")
-            ing_index = 0
-            for i in ings:
-                ing_strs = []
-                amt, unit = self.rg.rd.get_amount_and_unit(
-                    i, mult=self.recipe_display.mult, conv=(self.prefs.get("readableUnits", True) and self.rg.conv or None)
-                )
-                if amt:
-                    ing_strs.append(amt)
-                if unit:
-                    ing_strs.append(unit)
-                if i.item:
-                    ing_strs.append(i.item)
-                if i.optional:
-                    ing_strs.append(_("(Optional)"))
-                istr = xml.sax.saxutils.escape(" ".join(ing_strs))
+        for group_index, (group, ings) in enumerate(self.ing_alist):
+            labels = [f"<u>{escape(group)}</u>"] if group else []
+            for ing_index, i in enumerate(ings):
+                amt, unit = get_amount_and_unit(i, mult, conv)
+                istr = escape(" ".join(s for s in (amt, unit, i.item, i.optional and optional) if s))
                 if i.refid:
-                    istr = f'<a href="{i.refid}:{xml.sax.saxutils.escape(i.item)}">' f"{istr}</a>"
-                istr = self.run_markup_ingredient_hooks(istr, i, ing_index, group_index)
+                    istr = f'<a href="{i.refid}:{escape(i.item)}">{istr}</a>'
+                if run_hooks is not None:
+                    istr = run_hooks(istr, i, ing_index, group_index)
                 labels.append(istr)
-                ing_index += 1
-
             group_strings.append("\n".join(labels))
-            group_index += 1
 
         label = "\n\n".join(group_strings)
 
@@ -688,6 +897,7 @@ class IngredientDisplay:
         """Create alist ing_alist based on ingredients in DB for current_rec"""
         ings = self.rg.rd.get_ings(self.get_current_rec())
         self.ing_alist = self.rg.rd.order_ings(ings)
+        self._amount_cache.clear()
         debug("self.ing_alist updated: %s" % self.ing_alist, 1)
 
     # Callbacks
@@ -784,11 +994,10 @@ class RecEditor(WidgetSaver.WidgetPrefs, plugin_loader.Pluggable):
 
         self.set_edited(False)
         plugin_loader.Pluggable.__init__(self, [ToolPlugin, RecEditorPlugin])
-        self.mm = mnemonic_manager.MnemonicManager()
-        self.mm.add_toplevel_widget(self.window)
-        self.mm.fix_conflicts_peacefully()
+        self.mm = None  # set up by fix_mnemonics, once the editor is idle
         self.show()
         self.modules[0].grab_focus()
+        GLib.idle_add(self.fix_mnemonics, priority=GLib.PRIORITY_LOW)
 
     def present(self):
         self.window.present()
@@ -805,24 +1014,22 @@ class RecEditor(WidgetSaver.WidgetPrefs, plugin_loader.Pluggable):
         fix_action_group_importance(self.rg.toolActionGroup)
         self.ui_manager.insert_action_group(self.rg.toolActionGroup, 1)
 
-    def setup_action_groups(self):
-        self.mainRecEditActionGroup = Gtk.ActionGroup(name="RecEditMain")
+    main_actions = [
+        # menus
+        ("Recipe", None, _("_Recipe")),
+        ("Edit", None, _("_Edit")),
+        ("Help", Gtk.STOCK_HELP, None),
+        ("HelpMenu", None, _("_Help")),
+        ("Save", Gtk.STOCK_SAVE, None, "<Control>s", _("Save edits to database"), "save_cb"),  # saveEdits
+        ("DeleteRecipe", Gtk.STOCK_DELETE, _("_Delete Recipe"), None, None, "delete_cb"),
+        ("Revert", Gtk.STOCK_REVERT_TO_SAVED, None, None, None, "revert_cb"),  # revertCB
+        ("Close", Gtk.STOCK_CLOSE, None, None, None, "close_cb"),
+        ("Preferences", Gtk.STOCK_PREFERENCES, None, None, None, "preferences_cb"),  # show_pref_dialog
+        ("ShowRecipeCard", "recipe-card", _("View Recipe Card"), None, None, "show_recipe_display_cb"),  # view_recipe_card
+    ]
 
-        self.mainRecEditActionGroup.add_actions(
-            [
-                # menus
-                ("Recipe", None, _("_Recipe")),
-                ("Edit", None, _("_Edit")),
-                ("Help", Gtk.STOCK_HELP, None),
-                ("HelpMenu", None, _("_Help")),
-                ("Save", Gtk.STOCK_SAVE, None, "<Control>s", _("Save edits to database"), self.save_cb),  # saveEdits
-                ("DeleteRecipe", Gtk.STOCK_DELETE, _("_Delete Recipe"), None, None, self.delete_cb),
-                ("Revert", Gtk.STOCK_REVERT_TO_SAVED, None, None, None, self.revert_cb),  # revertCB
-                ("Close", Gtk.STOCK_CLOSE, None, None, None, self.close_cb),
-                ("Preferences", Gtk.STOCK_PREFERENCES, None, None, None, self.preferences_cb),  # show_pref_dialog
-                ("ShowRecipeCard", "recipe-card", _("View Recipe Card"), None, None, self.show_recipe_display_cb),  # view_recipe_card
-            ]
-        )
+    def setup_action_groups(self):
+        self.mainRecEditActionGroup = make_action_group("RecEditMain", self.main_actions, self)
 
     def setup_modules(self):
         self.modules = []
@@ -837,11 +1044,23 @@ class RecEditor(WidgetSaver.WidgetPrefs, plugin_loader.Pluggable):
             instance.connect("toggle-edited", self.module_edited_cb)
             self.modules.append(instance)
 
+    def fix_mnemonics(self) -> bool:
+        """Resolve mnemonic conflicts across the whole editor window.
+
+        This walks every widget in the window, so it is done once the
+        editor is idle, rather than while it opens.
+        """
+        if self.window.get_realized():
+            self.mm = mnemonic_manager.MnemonicManager()
+            self.mm.add_toplevel_widget(self.window)
+            self.mm.fix_conflicts_peacefully()
+        return False
+
     def add_plugin(self, klass, position=None):
         """Register any external plugins"""
-        instance = klass(self)
-        if instance.__class__ in self.editor_module_classes:
+        if klass in self.editor_module_classes:
             return  # these are handled in setup_modules...
+        instance = klass(self)
         tab_label = Gtk.Label(label=instance.label)
         if not position:
             n = self.notebook.append_page(instance.main, tab_label=tab_label)
@@ -849,13 +1068,13 @@ class RecEditor(WidgetSaver.WidgetPrefs, plugin_loader.Pluggable):
             n = self.notebook.insert_page(instance.main, tab_label=tab_label, position=position)
             # We'll need to reset the other plugin's positions if we shoved one in the middle
             for mod in self.modules[position:]:
-                self.module_tab_by_name[mod.name] = self.notebook.page_num(mod.main)
+                self.module_tab_by_name[mod.name] += 1
         self.module_tab_by_name[instance.name] = n
         # self.plugins.append(instance)
         if not position:
             self.modules.append(instance)
         else:
-            self.modules = self.modules[:position] + [instance] + self.modules[position:]
+            self.modules.insert(position, instance)
         instance.main.show()
         tab_label.show()
         instance.connect("toggle-edited", self.module_edited_cb)
@@ -906,6 +1125,7 @@ class RecEditor(WidgetSaver.WidgetPrefs, plugin_loader.Pluggable):
         self.notebook.set_tab_pos(Gtk.PositionType.LEFT)
         self._last_module = None
         self.last_merged_ui = None
+        self.last_merged_ui_string = None
         self.last_merged_action_groups = None
         self.notebook_change_cb()
 
@@ -919,24 +1139,42 @@ class RecEditor(WidgetSaver.WidgetPrefs, plugin_loader.Pluggable):
             self.mainRecEditActionGroup.get_action("Revert").set_sensitive(False)
 
     def update_from_database(self):
-        for mod in self.modules:
+        """Reload edited modules from the database.
+
+        Modules without edits already show what is in the database, and
+        reloading them (the ingredient tree in particular) is costly.
+        """
+        edited = [mod for mod in self.modules if mod.edited]
+        self.widgets_changed_since_save = {}
+        for mod in edited:
             mod.update_from_database()
-            mod.__edited = False
+            mod.edited = False
 
     def notebook_change_cb(self, *args):
         """Update menus and toolbars"""
         page = self.notebook.get_current_page()
+        module = self.modules[page]
+        if self.last_merged_ui is not None and module is self._last_module:
+            # This page's menus are already merged: switch-page handlers are
+            # queued on idle, so a quick flip back and forth can land here
+            # several times for the same page.
+            return
         # self.history.switch_context(page)
+        # Modules of the same kind share their ui_string; the merged menus
+        # and toolbars can then stay, and only the actions need swapping.
+        same_ui = self.last_merged_ui is not None and module.ui_string == self.last_merged_ui_string
         if self.last_merged_ui is not None:
-            self.ui_manager.remove_ui(self.last_merged_ui)
+            if not same_ui:
+                self.ui_manager.remove_ui(self.last_merged_ui)
             for ag in self.last_merged_action_groups:
                 self.ui_manager.remove_action_group(ag)
-        self.last_merged_ui = self.ui_manager.add_ui_from_string(self.modules[page].ui_string)
-        for ag in self.modules[page].action_groups:
+        if not same_ui:
+            self.last_merged_ui = self.ui_manager.add_ui_from_string(module.ui_string)
+            self.last_merged_ui_string = module.ui_string
+        for ag in module.action_groups:
             fix_action_group_importance(ag)
             self.ui_manager.insert_action_group(ag, 0)
-        self.last_merged_action_groups = self.modules[page].action_groups
-        module = self.modules[page]
+        self.last_merged_action_groups = module.action_groups
         if self._last_module and self._last_module != module and hasattr(self._last_module, "leave_page"):
             self._last_module.leave_page()
         if module:
@@ -954,14 +1192,12 @@ class RecEditor(WidgetSaver.WidgetPrefs, plugin_loader.Pluggable):
             newdict = m.save(newdict)
         self.current_rec = self.rg.rd.modify_rec(self.current_rec, newdict)
         self.rg.rd.update_hashes(self.current_rec)
-        self.rg.rmodel.update_recipe(self.current_rec)
         if "title" in newdict:
             self.window.set_title(f"{self.edit_title} " f"{self.current_rec.title.strip()}")
         self.set_edited(False)
         self.reccard.new = False
         self.rg.rd.save()
-        self.rg.update_go_menu()
-        self.rg.redo_search()  # Trigger a refresh of the recipe tree
+        self.rg.queue_post_save_refresh(self.current_rec)  # index and Go menu
         self.reccard.update_recipe(self.current_rec)  # update display (if any)
 
     def revert_cb(self, *args):
@@ -990,7 +1226,10 @@ class RecEditor(WidgetSaver.WidgetPrefs, plugin_loader.Pluggable):
         if self.new:
             # If we are new and unedited, delete...
             self.rg.rd.delete_rec(self.current_rec)
-            self.rg.redo_search()
+            # ...and only search again if the empty recipe made it into the
+            # results shown in the index.
+            if self.rg.rmodel.has_recipe(self.current_rec):
+                self.rg.redo_search()
         return True
 
     def preferences_cb(self, *args):
@@ -1036,11 +1275,12 @@ class IngredientEditorModule(RecEditorModule):
     """
 
     def setup(self):
-        pass
+        # Parsed ingredient lines, keyed by the text typed or pasted.
+        self._parsed_lines = {}
 
     def setup_main_interface(self):
         self.ui = Gtk.Builder()
-        self.ui.add_from_string(get_data("gourmand", "ui/recCardIngredientsEditor.ui").decode())
+        self.ui.add_from_string(_load_ui_xml("recCardIngredientsEditor.ui"))
         self.main = self.ui.get_object("ingredientsNotebook")
         self.main.unparent()
         self.ingtree_ui = IngredientTreeUI(self, self.ui.get_object("ingTree"))
@@ -1101,7 +1341,9 @@ class IngredientEditorModule(RecEditorModule):
         self.action_groups.append(self.ingredientEditorActionGroup)
         self.action_groups.append(self.ingredientEditorOnRowActionGroup)
 
-    def add_ingredient_from_line(self, line: str, group_iter: Optional[Gtk.TreeIter] = None, prev_iter: Optional[Gtk.TreeIter] = None):
+    def add_ingredient_from_line(
+        self, line: str, group_iter: Optional[Gtk.TreeIter] = None, prev_iter: Optional[Gtk.TreeIter] = None, select_and_scroll: bool = True
+    ):
         """Add an ingredient to the list from a line of plain text.
 
         The line will parsed if it matches the expected format of
@@ -1112,17 +1354,37 @@ class IngredientEditorModule(RecEditorModule):
         `prev_iter` is a tree iterator used to keep track of a previously
         selected item, so that the new ingredient can be added right below it in
         the tree.
+        `select_and_scroll` can be set to False when adding several lines in a
+        row, so that the view is only moved once, for the last of them.
         """
-        d = self.rg.rd.parse_ingredient(line, conv=self.rg.conv, get_key=False)
-        if d:
-            if "rangeamount" in d:
-                d["amount"] = self.rg.rd.format_amount_string_from_amount((d["amount"], d["rangeamount"]))
-                del d["rangeamount"]
-            elif "amount" in d:
-                d["amount"] = convert.float_to_frac(d["amount"])
-        else:
-            d = {"item": line, "amount": None, "unit": None}
+        d = self.parse_line(line)
         itr = self.ingtree_ui.ingController.add_new_ingredient(prev_iter=prev_iter, group_iter=group_iter, **d)
+        if select_and_scroll:
+            self.show_added_ingredient(itr)
+        return itr
+
+    def parse_line(self, line: str) -> Dict[str, Any]:
+        """Parse a line of text into the fields of a new ingredient row.
+
+        Users tend to add the same lines again and again, so results are
+        kept until the next save, when newly stored units may change what
+        the parser recognizes.
+        """
+        d = self._parsed_lines.get(line)
+        if d is None:
+            d = self.rg.rd.parse_ingredient(line, conv=self.rg.conv, get_key=False)
+            if d:
+                if "rangeamount" in d:
+                    d["amount"] = self.rg.rd.format_amount_string_from_amount((d["amount"], d["rangeamount"]))
+                    del d["rangeamount"]
+                elif "amount" in d:
+                    d["amount"] = convert.float_to_frac(d["amount"])
+            else:
+                d = {"item": line, "amount": None, "unit": None}
+            self._parsed_lines[line] = d
+        return dict(d)
+
+    def show_added_ingredient(self, itr: Gtk.TreeIter):
         # If there is just one row selected...
         sel = self.ingtree_ui.ingTree.get_selection()
         if sel.count_selected_rows() == 1:
@@ -1132,24 +1394,26 @@ class IngredientEditorModule(RecEditorModule):
         # Make sure our newly added ingredient is visible...
         self.ingtree_ui.ingTree.scroll_to_cell(self.ingtree_ui.ingController.imodel.get_path(itr))
 
-        return itr
-
     def paste_ingredients_cb(self):
         text = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD).wait_for_text()
+        if not text:
+            return
 
+        itr = None
         for line in text.split("\n"):
             if line.strip():
-                self.add_ingredient_from_line(line)
+                itr = self.add_ingredient_from_line(line, select_and_scroll=False)
+        if itr is not None:
+            self.show_added_ingredient(itr)
 
     def delete_cb(self, *args):
         debug("delete_cb (self, *args):", 5)
-        mod, rows = self.ingtree_ui.ingTree.get_selection().get_selected_rows()
-        rows.reverse()
-        self.ingtree_ui.ingController.delete_iters(*[mod.get_iter(p) for p in rows])
+        self.ingtree_ui.ingController.delete_iters(*reversed(self.ingtree_ui.getSelectedIters() or []))
 
     def save(self, recdic):
         # Save ingredients...
         self.ingtree_ui.ingController.commit_ingredients()
+        self._parsed_lines.clear()
         self.emit("saved")
         return recdic
 
@@ -1161,32 +1425,68 @@ class TextEditor:
         self.edit_textviews = []  # for keeping track of editable
         # textviews
 
+    copy_paste_actions = [
+        ("Copy", Gtk.STOCK_COPY, None, None, None, "do_copy"),
+        ("Paste", Gtk.STOCK_PASTE, None, "<Control>V", None, "paste_cb"),
+        ("Cut", Gtk.STOCK_CUT, None, None, None, "do_cut"),
+    ]
+
     def setup_action_groups(self):
-        self.copyPasteActionGroup = Gtk.ActionGroup(name="CopyPasteActionGroup")
-        self.copyPasteActionGroup.add_actions(
-            [
-                ("Copy", Gtk.STOCK_COPY, None, None, None, self.do_copy),
-                ("Paste", Gtk.STOCK_PASTE, None, "<Control>V", None, self.paste_cb),
-                ("Cut", Gtk.STOCK_CUT, None, None, None, self.do_cut),
-            ]
-        )
+        self.copyPasteActionGroup = make_action_group("CopyPasteActionGroup", self.copy_paste_actions, self)
         self.cb = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-        GLib.timeout_add(500, self.do_sensitize)  # FIXME: make event-driven
+        # The clipboard outlives us, so drop the handler with our widgets.
+        self._clipboard_handler = self.cb.connect("owner-change", self.clipboard_owner_change_cb)
+        self._paste_available: Optional[bool] = None  # None until asked
         self.action_groups.append(self.copyPasteActionGroup)
 
+    def add_edit_widget(self, widget: Gtk.Widget):
+        """Track an editable widget, keeping Cut/Copy/Paste in sync with it."""
+        self.edit_widgets.append(widget)
+        widget.connect("focus-in-event", self.sensitize_cb)
+        if isinstance(widget, Gtk.Entry):
+            widget.connect("notify::selection-bound", self.sensitize_cb)
+        widget.connect("destroy", self.disconnect_clipboard_cb)
+
+    def add_edit_textview(self, tv: Gtk.TextView):
+        """Track a textview, keeping Cut/Copy/Paste in sync with it."""
+        self.edit_textviews.append(tv)
+        tv.connect("focus-in-event", self.sensitize_cb)
+        tv.get_buffer().connect("notify::has-selection", self.sensitize_cb)
+        tv.connect("destroy", self.disconnect_clipboard_cb)
+
+    def disconnect_clipboard_cb(self, *args):
+        if getattr(self, "_clipboard_handler", 0):
+            self.cb.disconnect(self._clipboard_handler)
+            self._clipboard_handler = 0
+
+    def clipboard_owner_change_cb(self, *args):
+        self._paste_available = None
+        self.do_sensitize()
+
+    def sensitize_cb(self, *args):
+        self.do_sensitize()
+        return False  # let focus events propagate
+
+    def paste_available(self) -> bool:
+        # Asking the clipboard is a round trip to the display server; the
+        # answer only changes when the clipboard changes hands.
+        if self._paste_available is None:
+            self._paste_available = bool(self.cb.wait_is_text_available())
+        return self._paste_available
+
     def do_sensitize(self):
         for w in self.edit_widgets:
             if w.has_focus():
-                self.copyPasteActionGroup.get_action("Copy").set_sensitive(w.get_selection_bounds() and True or False)
-                self.copyPasteActionGroup.get_action("Cut").set_sensitive(w.get_selection_bounds() and True or False)
-                self.copyPasteActionGroup.get_action("Paste").set_sensitive(self.cb.wait_is_text_available() or False)
-                return True
+                has_selection = bool(w.get_selection_bounds())
+                self.copyPasteActionGroup.get_action("Copy").set_sensitive(has_selection)
+                self.copyPasteActionGroup.get_action("Cut").set_sensitive(has_selection)
+                self.copyPasteActionGroup.get_action("Paste").set_sensitive(self.paste_available())
+                return
         for tv in self.edit_textviews:
-            tb = tv.get_buffer()
-            self.copyPasteActionGroup.get_action("Copy").set_sensitive(tb.get_selection_bounds() and True or False)
-            self.copyPasteActionGroup.get_action("Cut").set_sensitive(tb.get_selection_bounds() and True or False)
-            self.copyPasteActionGroup.get_action("Paste").set_sensitive(self.cb.wait_is_text_available() or False)
-        return True
+            has_selection = tv.get_buffer().get_has_selection()
+            self.copyPasteActionGroup.get_action("Copy").set_sensitive(has_selection)
+            self.copyPasteActionGroup.get_action("Cut").set_sensitive(has_selection)
+            self.copyPasteActionGroup.get_action("Paste").set_sensitive(self.paste_available())
 
     def do_copy(self, action: Gtk.Action):
         # Get any widget to get a hold of the window
@@ -1250,12 +1550,13 @@ class DescriptionEditorModule(TextEditor, RecEditorModule):
         self.recent: List[str] = []  # Keep track of freely editable widgets
         self.reccom: List[str] = []  # Keep track of ComboBoxText widgets
         self.rw: Dict[str, Gtk.Widget] = {}  # Attribute names and their widgets
+        self.undoers: Dict[str, Any] = {}  # Attribute names and their Undo wrappers
 
         super().__init__(editor)
 
     def setup_main_interface(self):
         self.ui = Gtk.Builder()
-        self.ui.add_from_string(get_data("gourmand", "ui/recCardDescriptionEditor.ui").decode())
+        self.ui.add_from_string(_load_ui_xml("recCardDescriptionEditor.ui"))
         self.imageBox = ImageBox(self)
         self.init_recipe_widgets()
         self.ui.connect_signals(
@@ -1268,13 +1569,8 @@ class DescriptionEditorModule(TextEditor, RecEditorModule):
         self.main.unparent()
 
     def init_recipe_widgets(self) -> None:
-        for attribute, label, widget_type in REC_ATTRS:
-            if widget_type == "Entry":
-                self.recent.append(attribute)
-            elif widget_type == "Combo":
-                self.reccom.append(attribute)
-            else:
-                raise ValueError(f"{attribute} with {widget_type} not supported")
+        self.recent = list(_ENTRY_REC_ATTRS)
+        self.reccom = list(_COMBO_REC_ATTRS)
 
         for attribute in self.reccom + self.recent:
             widget = self.ui.get_object(f"{attribute}Box")
@@ -1285,6 +1581,10 @@ class DescriptionEditorModule(TextEditor, RecEditorModule):
             self.rw[attribute] = widget
             self.edit_widgets.append(widget)
             widget.db_prop = attribute
+            if attribute in self.reccom:
+                widget.set_model(self.rg.get_attribute_model(attribute))
+                widget.set_entry_text_column(0)
+                cb.setup_completion(widget)
 
             # Set up accessibility
             atk = widget.get_accessible()
@@ -1303,50 +1603,85 @@ class DescriptionEditorModule(TextEditor, RecEditorModule):
 
         for c in self.reccom:
             debug(f"Widget for {c}", 5)
-
-            model = self.rg.get_attribute_model(c)
-
-            self.rw[c].set_model(model)
-            self.rw[c].set_entry_text_column(0)
-
-            cb.setup_completion(self.rw[c])
             if c == "category":
                 val = ", ".join(self.rg.rd.get_cats(self.current_rec))
             else:
                 val = getattr(self.current_rec, c)
-            self.rw[c].insert_text(0, val or "")
+            # The model is shared with every other editor, so the value
+            # goes straight into the entry rather than into the model.
+            with self.quiet_undo(c):
+                self.rw[c].get_child().set_text(val or "")
+
+        for e in self.recent:
+            with self.quiet_undo(e):
+                if isinstance(self.rw[e], Gtk.SpinButton):
+                    try:
+                        self.rw[e].set_value(float(getattr(self.current_rec, e)))
+                    except (TypeError, ValueError):
+                        debug("%s Value %s is not floatable!" % (e, getattr(self.current_rec, e)))
+                        self.rw[e].set_text("")
+                elif e in INT_REC_ATTRS:
+                    self.rw[e].set_value(int(getattr(self.current_rec, e) or 0))
+                else:
+                    self.rw[e].set_text(getattr(self.current_rec, e) or "")
+
+        if not self.undoers:
+            self.setup_undoers()
+        self.imageBox.get_image()
+
+    def setup_undoers(self):
+        """Wrap our widgets for undo, once they hold their first values.
+
+        This is only done once: wrapping them again on every reload would
+        pile up signal handlers on the widgets.
+        """
+        for c in self.reccom:
             if isinstance(self.rw[c], Gtk.ComboBoxText):
-                self.rw[c].set_active(0)
-                Undo.UndoableEntry(self.rw[c], self.history)
+                self.undoers[c] = Undo.UndoableEntry(self.rw[c], self.history)
                 cb.FocusFixer(self.rw[c])
-
         for e in self.recent:
             if isinstance(self.rw[e], Gtk.SpinButton):
-                try:
-                    self.rw[e].set_value(float(getattr(self.current_rec, e)))
-                except (TypeError, ValueError):
-                    debug("%s Value %s is not floatable!" % (e, getattr(self.current_rec, e)))
-                    self.rw[e].set_text("")
-                Undo.UndoableGenericWidget(self.rw[e], self.history, signal="value-changed")
+                self.undoers[e] = Undo.UndoableGenericWidget(self.rw[e], self.history, signal="value-changed")
             elif e in INT_REC_ATTRS:
-                self.rw[e].set_value(int(getattr(self.current_rec, e) or 0))
-                Undo.UndoableGenericWidget(self.rw[e], self.history)
+                self.undoers[e] = Undo.UndoableGenericWidget(self.rw[e], self.history)
             else:
-                self.rw[e].set_text(getattr(self.current_rec, e) or "")
-                Undo.UndoableEntry(self.rw[e], self.history)
-        self.imageBox.get_image()
+                self.undoers[e] = Undo.UndoableEntry(self.rw[e], self.history)
+
+    @contextmanager
+    def quiet_undo(self, attribute: str):
+        """Change attribute's widget without recording an undoable edit.
+
+        The value set becomes the new starting point for undo.
+        """
+        undoer = self.undoers.get(attribute)
+        if undoer is None:
+            yield
+        else:
+            with undoer.quiet():
+                yield
 
     def grab_focus(self):
         self.ui.get_object("titleBox").grab_focus()
 
     def save(self, recdic):
+        # Only hand over the attributes that differ from the stored recipe,
+        # so that the update only touches columns that actually changed.
+        stored_rec = self.re.current_rec
         for c in self.reccom:
-            recdic[c] = str(self.rw[c].get_active_text())
+            val = str(self.rw[c].get_active_text())
+            if c == "category":
+                stored = ", ".join(self.rg.rd.get_cats(stored_rec))
+            else:
+                stored = getattr(stored_rec, c)
+            if val != stored:
+                recdic[c] = val
         for e in self.recent:
-            if e in INT_REC_ATTRS + FLOAT_REC_ATTRS:
-                recdic[e] = self.rw[e].get_value()
+            if e in _NUMERIC_REC_ATTRS:
+                val = self.rw[e].get_value()
             else:
-                recdic[e] = str(self.rw[e].get_text())
+                val = str(self.rw[e].get_text())
+            if val != getattr(stored_rec, e):
+                recdic[e] = val
 
         if self.imageBox.edited:
             image, thumbnail = self.imageBox.commit()
@@ -1371,7 +1706,10 @@ class ImageBox:
         self.addW = self.ui.get_object("addImage")
         self.delW = self.ui.get_object("delImageButton")
         self.image: Image.Image = None
-        self.thumbnail: Image.Image = None
+        # Full size image the displayed one is derived from, when there is one
+        self._orig_image: Optional[Image.Image] = None
+        self._loaded_file: Optional[Tuple[str, Image.Image]] = None
+        self._drawn: Optional[Tuple[Image.Image, Tuple[int, int], Image.Image]] = None
 
     def get_image(self, rec=None):  # rec is optional RowProxy
         """Set image based on current recipe."""
@@ -1396,14 +1734,17 @@ class ImageBox:
         debug("commit (self):", 5)
         if self.image:
             self.imageW.show()
-            return iu.image_to_bytes(self.image), iu.image_to_bytes(self.thumbnail)
+            thumbnail = self.image.copy()
+            thumbnail.thumbnail((40, 40))
+            return iu.image_to_bytes(self.image), iu.image_to_bytes(thumbnail)
         else:
             self.imageW.hide()
             return None, None
 
     def draw_image(self):
         """Put image onto widget"""
-        if not self.image:
+        source = self._orig_image if self._orig_image is not None else self.image
+        if not source:
             self.hide()
             return
 
@@ -1415,8 +1756,13 @@ class ImageBox:
         else:
             size = (100, 100)
 
-        self.image.thumbnail(size)
-        self.set_from_bytes(iu.image_to_bytes(self.image))
+        # Resample a copy, so that the source never loses resolution, and
+        # keep it around in case we are asked for the same thing again.
+        if not (self._drawn and self._drawn[0] is source and self._drawn[1] == size):
+            image = source.copy()
+            image.thumbnail(size)
+            self._drawn = (source, size, image)
+        self.set_from_image(self._drawn[2])
 
     def show_image(self):
         """Show widget and switch around buttons sensibly"""
@@ -1427,21 +1773,26 @@ class ImageBox:
 
     def set_from_bytes(self, bytes_: bytes):
         debug("set_from_bytes(self, bytes):", 5)
+        self.set_from_image(iu.bytes_to_image(bytes_))
 
-        pb = iu.bytes_to_pixbuf(bytes_)
+    def set_from_image(self, image: Image.Image):
+        """Show a PIL image, building the pixbuf from its pixels."""
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGB")
+        pb = iu.image_to_pixbuf(image)
         self.imageW.set_from_pixbuf(pb)
         self.orig_pixbuf = pb
-
-        self.image = iu.bytes_to_image(bytes_)
-        self.thumbnail = self.image.copy()
-        self.thumbnail.thumbnail((40, 40))
+        self.image = image
 
         self.show_image()
         self.edited = True
 
     def set_from_file(self, filename: str):
         debug("set_from_file (self, file):", 5)
-        self.image = Image.open(filename)
+        # Redoing the addition of an image loads the same file again
+        if self._loaded_file is None or self._loaded_file[0] != filename:
+            self._loaded_file = (filename, Image.open(filename))
+        self._orig_image = self._loaded_file[1]
         self.draw_image()
 
     def set_from_file_callback(self, widget: Gtk.Button):
@@ -1451,14 +1802,15 @@ class ImageBox:
             self.edited = True
 
     def remove_image_callback(self, *args):
-        if self.image:
-            current_image = iu.image_to_bytes(self.image)
-        else:
-            _, current_image = self.orig_pixbuf.save_to_bufferv("jpeg", [], [])
-        Undo.UndoableObject(lambda *args: self.remove_image(), lambda *args: self.set_from_bytes(current_image), self.rc.history, widget=self.imageW).perform()
+        # Keep the image itself for undoing, rather than a JPEG encoding of it
+        current_image = self.image if self.image else iu.pixbuf_to_image(self.orig_pixbuf)
+        Undo.UndoableObject(
+            lambda *args: self.remove_image(), lambda *args: self.set_from_image(current_image.copy()), self.rc.history, widget=self.imageW
+        ).perform()
 
     def remove_image(self):
         self.image = None
+        self._orig_image = None
         self.orig_pixbuf = None
         self.draw_image()
         self.edited = True
@@ -1544,15 +1896,21 @@ class TextFieldEditor(TextEditor):
         self.update_from_database()
         Undo.UndoableTextView(self.tv, self.history)
         self.setup_action_groups()
-        self.edit_textviews = [self.tv]
+        self.add_edit_textview(self.tv)
+
+    # Above this many characters, the buffer is filled in while detached
+    # from our view, so that it is laid out once rather than per insert.
+    detach_buffer_length = 20000
 
     def update_from_database(self):
-        txt = getattr(self.re.current_rec, self.prop)
-        if txt:
-            txt = txt.encode("utf8", "ignore")
+        txt = getattr(self.re.current_rec, self.prop) or ""
+        buf = self.tv.get_buffer()
+        if len(txt) > self.detach_buffer_length:
+            self.tv.set_buffer(Gtk.TextBuffer())
+            buf.set_text(txt)
+            self.tv.set_buffer(buf)
         else:
-            txt = "".encode("utf8")
-        self.tv.get_buffer().set_text(txt)
+            buf.set_text(txt)
 
     def save(self, recdic):
         recdic[self.prop] = self.tv.get_buffer().get_text(include_hidden_chars=True)
@@ -1595,10 +1953,24 @@ class IngredientController(plugin_loader.Pluggable):
         self.re = self.ingredient_editor_module.re
         self.new_item_count = 0
         self.commited_items_converter = {}
+        # persistent ref (the value in column 0) -> Gtk.TreeRowReference
+        self._ref_index: Dict[Any, Gtk.TreeRowReference] = {}
+        # (ingredient, convert.USE_FRACTIONS) -> formatted amount
+        self._amount_strings: Dict[Tuple[Any, int], str] = {}
+        self._loader = None  # adds the rows of create_imodel still to come
+        self._load_idle_id = 0
+        self._loading = False
         plugin_loader.Pluggable.__init__(self, [IngredientControllerPlugin])
 
+    # Rows past the first batch are added from idle callbacks, so that
+    # the editor shows up before a long recipe is fully loaded.
+    load_batch_size = 50
+
     # Setup methods
     def create_imodel(self, rec):
+        if self._load_idle_id:
+            GLib.source_remove(self._load_idle_id)
+            self._load_idle_id = 0
         self.ingredient_objects = []
         self.current_rec = rec
         ings = self.rg.rd.get_ings(rec)
@@ -1614,15 +1986,67 @@ class IngredientController(plugin_loader.Pluggable):
             # GObject.TYPE_STRING,
             # GObject.TYPE_STRING
         )
+        self._ref_index = {}
+        self._loader = self._load_rows()
+        if self._load_batch(self.load_batch_size):
+            self._load_idle_id = GLib.idle_add(self._load_batch, self.load_batch_size)
+        return self.imodel
+
+    def _load_rows(self):
+        """Add the rows for self.ing_alist, yielding each row's group iter."""
+        # Appending to a TreeStore walks to the end of the parent's
+        # children, so we insert after the last row we added instead.
+        tail = None  # the last top-level row
         for g, ings in self.ing_alist:
             if g:
-                g = self.add_group(g)
+                g = tail = self.add_group(g, prev_iter=tail)
+            prev = None if g else tail
             for i in ings:
-                debug("adding ingredient %s" % i.item, 0)
-                self.add_ingredient(i, group_iter=g)
-        return self.imodel
+                if debug_level >= 3:
+                    debug("adding ingredient %s" % i.item, 3)
+                prev = self.add_ingredient(i, prev_iter=prev, group_iter=g)
+                yield g
+            if not g:
+                tail = prev
+
+    def _load_batch(self, size: Optional[int] = None) -> bool:
+        """Add up to size more rows, returning True while any are left."""
+        groups = []
+        self._loading = True
+        try:
+            for n, g in enumerate(self._loader, 1):
+                if g and not (groups and groups[-1] is g):
+                    groups.append(g)
+                if size and n >= size:
+                    break
+            else:
+                self._loader = None
+        finally:
+            self._loading = False
+        if self._load_idle_id:
+            # set_tree_for_rec only expanded the groups of the first batch.
+            tree = self.ingredient_editor_module.ingtree_ui.ingTree
+            for g in groups:
+                tree.expand_row(self.imodel.get_path(g), True)
+        if self._loader is None:
+            self._load_idle_id = 0
+            return False
+        return True
+
+    def finish_loading(self):
+        """Add any rows still waiting to be loaded, right away.
 
-    def _new_iter_(self, group_iter=None, prev_iter=None, fallback_on_append=True):
+        Anything that changes the structure of our model or saves it has
+        to call this first, since loading inserts after rows it has
+        already added.
+        """
+        if self._load_idle_id and not self._loading:
+            GLib.source_remove(self._load_idle_id)
+            self._load_batch()
+
+    def _new_iter_(self, group_iter=None, prev_iter=None, fallback_on_append=True, row=None):
+        """Insert a new row, filled in with the values in row if given."""
+        self.finish_loading()
         iter = None
         if group_iter and not prev_iter:
             if not isinstance(self.imodel.get_value(group_iter, 0), str):
@@ -1633,14 +2057,14 @@ class IngredientController(plugin_loader.Pluggable):
                 traceback.print_stack()
                 print("(not a real traceback, just a hint for fixing the old code)")
             else:
-                iter = self.imodel.append(group_iter)
+                iter = self.imodel.append(group_iter, row)
         if prev_iter:
-            iter = self.imodel.insert_after(None, prev_iter, None)
+            iter = self.imodel.insert_after(None, prev_iter, row)
         if not iter:
             if fallback_on_append:
-                iter = self.imodel.append(None)
+                iter = self.imodel.append(None, row)
             else:
-                iter = self.imodel.prepend(None)
+                iter = self.imodel.prepend(None, row)
         return iter
 
     # Add recipe info...
@@ -1655,14 +2079,15 @@ class IngredientController(plugin_loader.Pluggable):
         # (number)
         **ingdict,
     ):
-        iter = self._new_iter_(group_iter=group_iter, prev_iter=prev_iter, fallback_on_append=fallback_on_append)
         if "refid" in ingdict and ingdict["refid"]:
-            self.imodel.set_value(iter, 0, RecRef(ingdict["refid"], ingdict.get("item", "")))
+            ref = RecRef(ingdict["refid"], ingdict.get("item", ""))
         elif placeholder is not None:
-            self.imodel.set_value(iter, 0, placeholder)
+            ref = placeholder
         else:
-            self.imodel.set_value(iter, 0, self.new_item_count)
+            ref = self.new_item_count
             self.new_item_count += 1
+        iter = self._new_iter_(group_iter=group_iter, prev_iter=prev_iter, fallback_on_append=fallback_on_append, row=[ref, None, None, None, False])
+        self._register_ref(iter)
         self.update_ingredient_row(iter, **ingdict)
         return iter
 
@@ -1671,15 +2096,26 @@ class IngredientController(plugin_loader.Pluggable):
         return ret
 
     def undoable_update_ingredient_row(self, ref, d):
-        itr = self.ingredient_editor_module.ingtree_ui.ingController.get_iter_from_persistent_ref(ref)
-        orig = self.ingredient_editor_module.ingtree_ui.ingController.get_rowdict(itr)
+        itr = self.get_iter_from_persistent_ref(ref)
+        orig = self.get_rowdict(itr)
+        # The history only keeps the arguments, rather than a pair of
+        # closures, for each edit.
         Undo.UndoableObject(
-            lambda *args: self.update_ingredient_row(itr, **d),
-            lambda *args: self.update_ingredient_row(itr, **orig),
+            self._update_ingredient_row_from_dict,
+            self._update_ingredient_row_from_dict,
             self.ingredient_editor_module.history,
+            action_args=[itr, d],
+            undo_action_args=[itr, orig],
             widget=self.imodel,
         ).perform()
 
+    def _update_ingredient_row_from_dict(self, itr, d):
+        self.update_ingredient_row(itr, **d)
+
+    def set_value_for_ref(self, ref, colnum, value):
+        """Set column colnum of the row for persistent ref ref to value."""
+        self.imodel.set_value(self.get_iter_from_persistent_ref(ref), colnum, value)
+
     def update_ingredient_row(
         self, iter: Gtk.TreeIter,
         amount: Optional[float] = None,
@@ -1688,14 +2124,21 @@ class IngredientController(plugin_loader.Pluggable):
         optional: Optional[bool] = None,
         **unused
     ):
+        columns, values = [], []
         if amount is not None:
-            self.imodel.set_value(iter, 1, str(amount))
+            columns.append(1)
+            values.append(str(amount))
         if unit is not None:
-            self.imodel.set_value(iter, 2, unit)
+            columns.append(2)
+            values.append(unit)
         if item is not None:
-            self.imodel.set_value(iter, 3, item)
+            columns.append(3)
+            values.append(item)
         if optional is not None:
-            self.imodel.set_value(iter, 4, optional)
+            columns.append(4)
+            values.append(optional)
+        if columns:
+            self.imodel.set(iter, columns, values)
 
         if unused:
             debug(f"update_ingredient_row unused args: {unused}")
@@ -1719,18 +2162,10 @@ class IngredientController(plugin_loader.Pluggable):
         # Append our ingredient object to a list so that we will be able to notice if it has been deleted...
         if not is_undo:
             self.ingredient_objects.append(ing)
-        iter = self._new_iter_(prev_iter=prev_iter, group_iter=group_iter, fallback_on_append=fallback_on_append)
-        amt = self.rg.rd.get_amount_as_string(i)
-        unit = i.unit
-        self.imodel.set_value(iter, 0, i)
-        self.imodel.set_value(iter, 1, amt)
-        self.imodel.set_value(iter, 2, unit)
-        self.imodel.set_value(iter, 3, i.item)
-        if i.optional:
-            opt = True
-        else:
-            opt = False
-        self.imodel.set_value(iter, 4, opt)
+        amt = self.get_amount_string(i)
+        row = [i, amt, i.unit, i.item, bool(i.optional)]
+        iter = self._new_iter_(prev_iter=prev_iter, group_iter=group_iter, fallback_on_append=fallback_on_append, row=row)
+        self._register_ref(iter)
         # self.imodel.set_value(iter, 5, i.ingkey)
         # if shop_cat:
         #    self.imodel.set_value(iter, 6, shop_cat)
@@ -1741,28 +2176,59 @@ class IngredientController(plugin_loader.Pluggable):
         #    self.imodel.set_value(iter, 6, None)
         return iter
 
-    def add_group(self, name, prev_iter=None, children_iters=[], fallback_on_append=True):
+    def get_amount_string(self, ing) -> Optional[str]:
+        """Return the amount of ingredient object ing, formatted for display.
+
+        Ingredient rows are snapshots whose values never change, so the
+        same rows coming back through undo or a reload reuse the string.
+        """
+        key = (ing, convert.USE_FRACTIONS)
+        try:
+            return self._amount_strings[key]
+        except KeyError:
+            amt = self._amount_strings[key] = self.rg.rd.get_amount_as_string(ing)
+            return amt
+        except TypeError:
+            # Unhashable ingredient objects are simply not cached.
+            return self.rg.rd.get_amount_as_string(ing)
+
+    def add_group(self, name, prev_iter=None, children_iters=None, fallback_on_append=True):
+        self.finish_loading()
+        row = ["GROUP %s" % name, name, None, None, False]
         if not prev_iter:
             if fallback_on_append:
-                groupiter = self.imodel.append(None)
+                groupiter = self.imodel.append(None, row)
             else:
-                groupiter = self.imodel.prepend(None)
+                groupiter = self.imodel.prepend(None, row)
         else:
             # ALLOW NO NESTING!
             while self.imodel.iter_parent(prev_iter):
                 prev_iter = self.imodel.iter_parent(prev_iter)
-            groupiter = self.imodel.insert_after(None, prev_iter, None)
-        self.imodel.set_value(groupiter, 0, "GROUP %s" % name)
-        self.imodel.set_value(groupiter, 1, name)
-        children_iters.reverse()
-        for c in children_iters:
+            groupiter = self.imodel.insert_after(None, prev_iter, row)
+        self._register_ref(groupiter)
+        for c in reversed(children_iters or []):
             te.move_iter(self.imodel, c, None, parent=groupiter, direction="after")
             # self.rg.rd.undoable_modify_ing(self.imodel.get_value(c,0),
             #                               {'inggroup':name},
             #                               self.history)
-        debug("add_group returning %s" % groupiter, 5)
+        if debug_level >= 5:
+            debug("add_group returning %s" % groupiter, 5)
         return groupiter
 
+    def rename_group(self, groupiter, name):
+        """Rename the group at groupiter.
+
+        A group's persistent ref is made from its name, so we move its
+        entry in our ref index along with it, rather than leaving the
+        next lookup by the new name to rebuild the whole index.
+        """
+        try:
+            del self._ref_index[self.imodel.get_value(groupiter, 0)]
+        except KeyError:
+            pass
+        self.imodel.set(groupiter, [0, 1], ["GROUP %s" % name, name])
+        self._register_ref(groupiter)
+
     # def change_group (self, name,
     def delete_iters(self, *iters, **kwargs):
         """kwargs can have is_undo"""
@@ -1770,29 +2236,28 @@ class IngredientController(plugin_loader.Pluggable):
         refs = []
         undo_info = []
         try:
-            paths = [self.imodel.get_path(i) for i in iters]
+            paths = {tuple(self.imodel.get_path(i).get_indices()) for i in iters}
         except TypeError:
             print("Odd we are failing to get_paths for ", iters)
             print("Our undo stack looks like this...")
             print(self.ingredient_editor_module.history)
             raise
         for itr in iters:
-            orig_ref = self.get_persistent_ref_from_iter(itr)
             # We don't want to add children twice, once as a
             # consequent of their parents and once because they've
             # been selected in their own right.
-            parent = self.imodel.iter_parent(itr)
-            parent_path = parent and self.imodel.get_path(parent)
-            if parent_path in paths:
+            path = self.imodel.get_path(itr)
+            if path.get_depth() > 1 and tuple(path.get_indices()[:-1]) in paths:
                 # If our parent is in the iters to be deleted -- we
                 # don't need to delete it individual
                 continue
-            refs.append(orig_ref)
-            deleted_dic, prev_ref, ing_obj = self._get_undo_info_for_iter_(itr)
+            deleted_dic, prev_ref, ing_obj = self._get_undo_info_for_iter_(itr, path)
+            # Our ingredient object is also our persistent reference.
+            refs.append(ing_obj)
             child = self.imodel.iter_children(itr)
             children = []
             if child:
-                expanded = self.ingredient_editor_module.ingtree_ui.ingTree.row_expanded(self.imodel.get_path(itr))
+                expanded = self.ingredient_editor_module.ingtree_ui.ingTree.row_expanded(path)
             else:
                 expanded = False
             while child:
@@ -1820,26 +2285,101 @@ class IngredientController(plugin_loader.Pluggable):
             prev_path = te.path_next(path, -1)
         return prev_path
 
-    def _get_undo_info_for_iter_(self, iter):
-        deleted_dic = self.get_rowdict(iter)
-        path = self.imodel.get_path(iter)
+    def _get_undo_info_for_iter_(self, iter, path=None):
+        row = self.get_row(iter)
+        deleted_dic = self.get_rowdict(iter, row)
+        if path is None:
+            path = self.imodel.get_path(iter)
         prev_path = self._get_prev_path_(path)
         if prev_path:
             prev_ref = self.get_persistent_ref_from_path(prev_path)
         else:
             prev_ref = None
-        ing_obj = self.imodel.get_value(iter, 0)
-        return deleted_dic, prev_ref, ing_obj
+        return deleted_dic, prev_ref, row[0]
 
-    def do_delete_iters(self, iters):
-        for ref in iters:
-            i = self.get_iter_from_persistent_ref(ref)
-            if not i:
-                print("Failed to get reference from", i)
+    @contextmanager
+    def _bulk_update(self, select=None):
+        """Detach our model from the tree view while changing many rows.
+
+        Expanded and selected rows are remembered by persistent ref and
+        restored once the model is back; select can give the refs to
+        select instead. The cursor and scroll position are put back too.
+        The tree UI hears about the selection once, at the end. Yields
+        the list of refs to expand, which callers may add to.
+        """
+        tree_ui = self.ingredient_editor_module.ingtree_ui
+        tree = tree_ui.ingTree
+        selection = tree.get_selection()
+        expanded = []
+        tree.map_expanded_rows(lambda tv, path, *data: expanded.append(self.get_persistent_ref_from_path(path)))
+        selected = tree_ui.get_selected_refs()
+        cursor_path, cursor_col = tree.get_cursor()
+        cursor_ref = cursor_path and self.get_persistent_ref_from_path(cursor_path)
+        vadjustment = tree.get_vadjustment()
+        scrolled_to = vadjustment.get_value()
+        selection.handler_block_by_func(tree_ui.selection_changed_cb)
+        tree.set_model(None)
+        try:
+            yield expanded
+        finally:
+            tree.set_model(self.imodel)
+            for ref in expanded:
+                itr = self.get_iter_from_persistent_ref(ref)
+                if itr:
+                    tree.expand_row(self.imodel.get_path(itr), True)
+            if cursor_path:
+                # Selected rows are often the ones just deleted, so
+                # unless we were told what to select, don't go looking
+                # for them in the whole tree.
+                itr = self.get_iter_from_persistent_ref(cursor_ref) if select is not None else self._get_indexed_iter(cursor_ref)
+                if itr:
+                    cursor_path = self.imodel.get_path(itr)
+                elif not self._path_exists(cursor_path):
+                    # Our row is gone, and nothing took its place.
+                    cursor_path = None
+                if cursor_path:
+                    # Setting the cursor selects its row, so we do it
+                    # before putting the selection back.
+                    tree.set_cursor(cursor_path, cursor_col, False)
+                    selection.unselect_all()
+            if select is not None:
+                for ref in select:
+                    itr = self.get_iter_from_persistent_ref(ref)
+                    if itr:
+                        selection.select_iter(itr)
             else:
-                self.imodel.remove(i)
+                for ref in selected:
+                    itr = self._get_indexed_iter(ref)
+                    if itr:
+                        selection.select_iter(itr)
+            selection.handler_unblock_by_func(tree_ui.selection_changed_cb)
+            # The view only knows how tall its rows are once it has laid
+            # them out again, so scroll back when idle.
+            GLib.idle_add(vadjustment.set_value, scrolled_to)
+        tree_ui.selection_changed_cb()
+
+    def _path_exists(self, path: Gtk.TreePath) -> bool:
+        try:
+            self.imodel.get_iter(path)
+        except ValueError:
+            return False
+        return True
+
+    def do_delete_iters(self, iters):
+        self.finish_loading()
+        with self._bulk_update():
+            for ref in iters:
+                i = self.get_iter_from_persistent_ref(ref)
+                if not i:
+                    print("Failed to get reference from", i)
+                else:
+                    self.imodel.remove(i)
 
     def do_undelete_iters(self, rowdicts_and_iters):
+        with self._bulk_update() as to_expand:
+            self._undelete_iters(rowdicts_and_iters, to_expand)
+
+    def _undelete_iters(self, rowdicts_and_iters, to_expand):
         for rowdic, prev_iter, ing_obj, children, expanded in rowdicts_and_iters:
             prev_iter = self.get_iter_from_persistent_ref(prev_iter)
             # If ing_obj is a string, then we are a group
@@ -1871,20 +2411,24 @@ class IngredientController(plugin_loader.Pluggable):
                     else:
                         itr = self.add_ingredient_from_kwargs(group_iter=gi, prev_iter=pi, fallback_on_append=False, **rd)
                         self.imodel.set_value(itr, 0, io)
+                        self._register_ref(itr)
             if expanded:
-                self.ingredient_editor_module.ingtree_ui.ingTree.expand_row(self.imodel.get_path(itr), True)
+                to_expand.append(self.get_persistent_ref_from_iter(itr))
 
     # Get a dictionary describing our current row
-    def get_rowdict(self, iter):
-        d = {}
-        for k, n in [
-            ("amount", 1),
-            ("unit", 2),
-            ("item", 3),
-            ("optional", 4),
-        ]:
-            d[k] = self.imodel.get_value(iter, n)
-        ing_obj = self.imodel.get_value(iter, 0)
+    def get_row(self, iter) -> Tuple[Any, str, str, str, bool]:
+        """Return all of our columns for iter, fetched in one call."""
+        return self.imodel.get(iter, 0, 1, 2, 3, 4)
+
+    def get_rowdict(self, iter, row=None):
+        """Return a dictionary describing the row at iter.
+
+        row can be the result of get_row, if the caller already has it.
+        """
+        if row is None:
+            row = self.get_row(iter)
+        ing_obj, amount, unit, item, optional = row
+        d = {"amount": amount, "unit": unit, "item": item, "optional": optional}
         self.get_extra_ingredient_attributes(ing_obj, d)
         return d
 
@@ -1910,121 +2454,198 @@ class IngredientController(plugin_loader.Pluggable):
         if itr:
             return self.imodel.get_path(itr)
 
+    def _register_ref(self, itr: Gtk.TreeIter):
+        """Remember where the row holding itr's persistent ref lives."""
+        try:
+            self._ref_index[self.imodel.get_value(itr, 0)] = Gtk.TreeRowReference.new(self.imodel, self.imodel.get_path(itr))
+        except TypeError:
+            # Unhashable refs are found by walking the tree instead.
+            pass
+
+    def _get_indexed_iter(self, ref) -> Optional[Gtk.TreeIter]:
+        try:
+            rowref = self._ref_index.get(ref)
+        except TypeError:
+            # If ref is unhashable, we don't care
+            return None
+        # Rows moved by drag and drop or by te.move_iter are copied
+        # behind our back, so an indexed row may be gone or hold
+        # something else by now; check before trusting it.
+        if rowref is not None and rowref.valid():
+            itr = self.imodel.get_iter(rowref.get_path())
+            if self.imodel.get_value(itr, 0) == ref:
+                return itr
+        return None
+
+    def _index_row(self, model, path, itr):
+        """TreeModel.foreach callback adding a row to our ref index.
+
+        Only the first row holding a ref is indexed, as the tree walk
+        this replaces would only ever have found that one.
+        """
+        try:
+            ref = model.get_value(itr, 0)
+            if ref not in self._ref_index:
+                self._ref_index[ref] = Gtk.TreeRowReference.new(model, path)
+        except TypeError:
+            pass
+        return False
+
     def get_iter_from_persistent_ref(self, ref):
+        if ref is None:
+            # Nothing in our model has a None reference.
+            return None
         try:
             if ref in self.commited_items_converter:
                 ref = self.commited_items_converter[ref]
+            hash(ref)
         except TypeError:
-            # If ref is unhashable, we don't care
-            pass
-        itr = self.imodel.get_iter_first()
-        while itr:
-            v = self.imodel.get_value(itr, 0)
-            if v == ref or self.rg.rd.row_equal(v, ref):
-                return itr
-            child = self.imodel.iter_children(itr)
-            if child:
-                itr = child
-            else:
-                next = self.imodel.iter_next(itr)
-                if next:
-                    itr = next
-                else:
-                    parent = self.imodel.iter_parent(itr)
-                    if parent:
-                        itr = self.imodel.iter_next(parent)
-                    else:
-                        itr = None
+            # If ref is unhashable, we search the tree for it instead,
+            # letting GTK do the walking.
+            found = []
+
+            def find_ref(model, path, itr):
+                v = model.get_value(itr, 0)
+                if v == ref or self.rg.rd.row_equal(v, ref):
+                    found.append(itr.copy())
+                    return True
+                return False
+
+            self.imodel.foreach(find_ref)
+            return found[0] if found else None
+        itr = self._get_indexed_iter(ref)
+        if itr:
+            return itr
+        # The index is out of date, most likely because rows were moved
+        # behind our back; rebuild all of it in a single pass, rather
+        # than walking the tree again on the next miss.
+        self._ref_index = {}
+        self.imodel.foreach(self._index_row)
+        return self._get_indexed_iter(ref)
 
     def commit_ingredients(self):
         """Commit ingredients as they appear in tree to database."""
-        iter = self.imodel.get_iter_first()
+        self.finish_loading()
         n = 0
         # Start with a list of all ingredient object - we'll eliminate
         # each object as we come to it in our tree -- any items not
         # eliminated have been deleted.
-        deleted = self.ingredient_objects[:]
-
-        # We use an embedded function rather than a simple loop so we
-        # can recursively crawl our tree -- so think of commit_iter as
-        # the inside of the loop, only better
-
-        def commit_iter(iter, pos, group=None):
-            ing = self.imodel.get_value(iter, 0)
-            # If ingredient is a string, than this is a group
-            if isinstance(ing, str):
-                group = self.imodel.get_value(iter, 1)
-                i = self.imodel.iter_children(iter)
-                while i:
-                    pos = commit_iter(i, pos, group)
-                    i = self.imodel.iter_next(i)
-                return pos
-            # Otherwise, this is an ingredient...
+        deleted = set(self.ingredient_objects)
+        # Changes to existing ingredients, written all at once at the end.
+        modified = []
+
+        # commit_ing is the inside of our loop over ingredient rows,
+        # which are found by crawling the tree below.
+
+        def commit_ing(iter, row, pos, group):
+            ing = row[0]
+            d = self.get_rowdict(iter, row)
+            # Get the amount as amount and rangeamount
+            if d["amount"]:
+                amt, rangeamount = parse_range(d["amount"])
+                d["amount"] = amt
+                if rangeamount:
+                    d["rangeamount"] = rangeamount
             else:
-                d = self.get_rowdict(iter)
-                # Get the amount as amount and rangeamount
-                if d["amount"]:
-                    amt, rangeamount = parse_range(d["amount"])
-                    d["amount"] = amt
-                    if rangeamount:
-                        d["rangeamount"] = rangeamount
+                d["amount"] = None
+            # Get category info as necessary
+            if "shop_cat" in d:
+                self.rg.sl.orgdic[d["ingkey"]] = d["shop_cat"]
+                del d["shop_cat"]
+            d["position"] = pos
+            d["inggroup"] = group
+            # If we are a recref...
+            if isinstance(ing, RecRef):
+                d["refid"] = ing.refid
+            # If we are a real, old ingredient
+            if not isinstance(ing, (int, RecRef)):
+                # Remove all unchanged attrs from dict...
+                for att, val in zip(_COMPARED_ING_ATTRS, _get_compared_ing_attrs(ing)):
+                    if att in d and d[att] == val:
+                        del d[att]
+                if ing in deleted:
+                    # We have not been deleted...
+                    deleted.remove(ing)
                 else:
-                    d["amount"] = None
-                # Get category info as necessary
-                if "shop_cat" in d:
-                    self.rg.sl.orgdic[d["ingkey"]] = d["shop_cat"]
-                    del d["shop_cat"]
-                d["position"] = pos
-                d["inggroup"] = group
-                # If we are a recref...
-                if isinstance(ing, RecRef):
-                    d["refid"] = ing.refid
-                # If we are a real, old ingredient
-                if not isinstance(ing, (int, RecRef)):
-                    for att in ["amount", "unit", "item", "ingkey", "position", "inggroup", "optional"]:
-                        # Remove all unchanged attrs from dict...
-                        if hasattr(d, att):
-                            if getattr(ing, att) == d[att]:
-                                del d[att]
-                    if ing in deleted:
-                        # We have not been deleted...
-                        deleted.remove(ing)
-                    else:
-                        # In this case, we have an ingredient object
-                        # that is not reflected in our
-                        # ingredient_object list. This means the user
-                        # Deleted us, saved, and then clicked undo,
-                        # resulting in the trace object. In this case,
-                        # we need to set ing.deleted to False
-                        d["deleted"] = False
-                    if ing.deleted:  # If somehow our object is
-                        # deleted... (shouldn't be
-                        # possible, but why not check!)
-                        d["deleted"] = False
-                    if d:
-                        self.ingredient_editor_module.rg.rd.modify_ing_and_update_keydic(ing, d)
+                    # In this case, we have an ingredient object
+                    # that is not reflected in our
+                    # ingredient_object list. This means the user
+                    # Deleted us, saved, and then clicked undo,
+                    # resulting in the trace object. In this case,
+                    # we need to set ing.deleted to False
+                    d["deleted"] = False
+                if ing.deleted:  # If somehow our object is
+                    # deleted... (shouldn't be
+                    # possible, but why not check!)
+                    d["deleted"] = False
+                if d:
+                    modified.append((iter, ing, d))
+            else:
+                d["recipe_id"] = self.ingredient_editor_module.current_rec.id
+                self.commited_items_converter[ing] = self.rg.rd.add_ing_and_update_keydic(d)
+                self.imodel.set_value(iter, 0, self.commited_items_converter[ing])
+                self._register_ref(iter)
+                # Add ourself to the list of ingredient objects so
+                # we will notice subsequent deletions.
+                self.ingredient_objects.append(self.commited_items_converter[ing])
+            return pos + 1
+
+        # end commit ing
+
+        # Each stack entry is a row to carry on from, and the group
+        # its rows belong to.
+        stack = [(self.imodel.get_iter_first(), None)]
+        while stack:
+            iter, group = stack.pop()
+            while iter:
+                row = self.get_row(iter)
+                # If ingredient is a string, than this is a group
+                if isinstance(row[0], str):
+                    child = self.imodel.iter_children(iter)
+                    if child:
+                        stack.append((self.imodel.iter_next(iter), group))
+                        iter, group = child, row[1]
+                        continue
                 else:
-                    d["recipe_id"] = self.ingredient_editor_module.current_rec.id
-                    self.commited_items_converter[ing] = self.rg.rd.add_ing_and_update_keydic(d)
-                    self.imodel.set_value(iter, 0, self.commited_items_converter[ing])
-                    # Add ourself to the list of ingredient objects so
-                    # we will notice subsequent deletions.
-                    self.ingredient_objects.append(self.commited_items_converter[ing])
-                return pos + 1
-
-        # end commit iter
-
-        while iter:
-            n = commit_iter(iter, n)
-            iter = self.imodel.iter_next(iter)
+                    n = commit_ing(iter, row, n, group)
+                iter = self.imodel.iter_next(iter)
+        if modified:
+            self.rg.rd.modify_ings_and_update_keydic([(ing, d) for itr, ing, d in modified])
+            self._refresh_modified_ingredients(modified)
         # Now delete all deleted ings...  (We're not *really* deleting
         # them -- we're just setting a handy flag to delete=True. This
         # makes Undo faster. It also would allow us to allow users to
         # go back through their "ingredient Trash" if we wanted to put
         # in a user interface for them to do so.
-        for i in deleted:
-            self.ingredient_objects.remove(i)
-        self.rg.rd.modify_ings(deleted, {"deleted": True})
+        if deleted:
+            self.ingredient_objects = [i for i in self.ingredient_objects if i not in deleted]
+            self.rg.rd.modify_ings(deleted, {"deleted": True})
+        self._amount_strings.clear()
+
+    def _refresh_modified_ingredients(self, modified):
+        """Swap the ingredients we just wrote for fresh copies.
+
+        Our rows hold the ingredient objects as they were when we loaded
+        them, and the next save compares the tree against those to find
+        what changed; left stale, setting a value back to what it was at
+        load would look unchanged and never be written.
+        """
+        rd = self.rg.rd
+        fresh = {i.id: i for i in rd.fetch_all(rd.ingredients_table, id=("in", [ing.id for itr, ing, d in modified]))}
+        replaced = {}
+        for itr, ing, d in modified:
+            new = fresh[ing.id]
+            replaced[ing] = new
+            self.imodel.set_value(itr, 0, new)
+            self._register_ref(itr)
+        self.ingredient_objects = [replaced.get(i, i) for i in self.ingredient_objects]
+        # Our undo history still refers to the old objects, including
+        # ones that earlier saves already pointed on to these.
+        converter = self.commited_items_converter
+        for old, new in list(converter.items()):
+            if new in replaced:
+                converter[old] = replaced[new]
+        converter.update(replaced)
 
 
 class IngredientTreeUI:
@@ -2060,17 +2681,20 @@ class IngredientTreeUI:
 
     # Basic setup methods
 
+    # (column, heading, toggle, unit combo, expand) for each column we show.
+    ing_columns = (
+        (1, _("Amt"), False, False, False),
+        (2, _("Unit"), False, True, False),
+        (3, _("Item"), False, False, True),
+        (4, _("Optional"), True, False, False),
+        # (5, _('Key'), False, False, False),
+        # (6, _('Shopping Category'), False, False, False),
+    )
+
     def setup_columns(self):
         self.ingColsByName = {}
         self.ingColsByAttr = {}
-        for n, head, tog, model, style, expand in [
-            [1, _("Amt"), False, None, None, False],
-            [2, _("Unit"), False, self.rg.umodel, None, False],
-            [3, _("Item"), False, None, None, True],
-            [4, _("Optional"), True, None, None, False],
-            # [5,_('Key'),False,self.rg.inginfo.key_model,Pango.Style.ITALIC],
-            # [6,_('Shopping Category'),False,self.shopmodel,Pango.Style.ITALIC],
-        ]:
+        for n, head, tog, units, expand in self.ing_columns:
             # Toggle setup
             if tog:
                 renderer = Gtk.CellRendererToggle()
@@ -2079,31 +2703,19 @@ class IngredientTreeUI:
                 col = Gtk.TreeViewColumn(head, renderer, active=n)
             # Non-Toggle setup
             else:
-                if model:
+                if units:
                     debug("Using CellRendererCombo, n=%s" % n, 0)
                     renderer = Gtk.CellRendererCombo()
-                    renderer.set_property("model", model)
+                    renderer.set_property("model", self.rg.umodel)
                     renderer.set_property("text-column", 0)
                 else:
                     debug("Using CellRendererText, n=%s" % n, 0)
                     renderer = Gtk.CellRendererText()
                 renderer.set_property("editable", True)
-                renderer.connect("edited", self.ingtree_edited_cb, n, head)
-                # If we have gtk > 2.8, set up text-wrapping
-                try:
-                    renderer.get_property("wrap-width")
-                except TypeError:
-                    pass
-                else:
-                    renderer.set_property("wrap-mode", Pango.WrapMode.WORD)
-                    renderer.set_property("wrap-width", 150)
-                if head == _("Key"):
-                    try:
-                        renderer.connect("editing-started", self.ingtree_start_keyedit_cb)
-                    except Exception:
-                        debug("Editing-started connect failed. Upgrade GTK for this functionality.", 0)
-                if style:
-                    renderer.set_property("style", style)
+                # Look the attribute up once here rather than on every edit.
+                renderer.connect("edited", self.ingtree_edited_cb, n, self.head_to_att[head])
+                renderer.set_property("wrap-mode", Pango.WrapMode.WORD)
+                renderer.set_property("wrap-width", 150)
                 # Create Column
                 col = Gtk.TreeViewColumn(head, renderer, text=n)
             if expand:
@@ -2116,13 +2728,8 @@ class IngredientTreeUI:
             col.set_reorderable(True)
             col.set_resizable(True)
             col.set_alignment(0)
-            col.set_min_width(45)
-            # if n==2:     #unit
-            #    col.set_min_width(80)
-            if n == 3:  # item
-                col.set_min_width(130)
-            if n == 5:  # key
-                col.set_min_width(130)
+            # The item column gets more room than the others.
+            col.set_min_width(130 if n == 3 else 45)
             self.ingTree.append_column(col)
 
     def setup_drag_and_drop(self):
@@ -2146,22 +2753,25 @@ class IngredientTreeUI:
 
     # Callbacks and the like
 
+    _isearch_key = None
+    _isearch_folded_key = None
+
     def my_isearch(self, mod, col, key, iter, data=None):
+        # The key stays the same while we are handed every row in turn,
+        # so only fold its case once.
+        if key != self._isearch_key:
+            self._isearch_key = key
+            self._isearch_folded_key = key.casefold()
         # we ignore column info and search by item
-        val = mod.get_value(iter, 3)
-        # and by key
-        if val:
-            val += mod.get_value(iter, 5)
-            if val.lower().find(key.lower()) != -1:
-                return False
-            else:
-                return True
-        else:
-            val = mod.get_value(iter, 1)
-            if val and val.lower().find(key.lower()) != -1:
-                return False
-            else:
-                return True
+        ing, val, item = mod.get(iter, 0, 1, 3)
+        if item:
+            val = item
+            # and by key
+            ingkey = getattr(ing, "ingkey", None)
+            if ingkey:
+                val += ingkey
+        # Groups have no item, and are searched by name
+        return not (val and self._isearch_folded_key in val.casefold())
 
     def ingtree_row_activated_cb(self, tv, path, col, p=None):
         debug("ingtree_row_activated_cb (self, tv, path, col, p=None):", 5)
@@ -2181,8 +2791,7 @@ class IngredientTreeUI:
             return True
 
     def selection_changed_cb(self, *args):
-        model, rows = self.ingTree.get_selection().get_selected_rows()
-        self.selection_changed(rows and True)
+        self.selection_changed(self.ingTree.get_selection().count_selected_rows() > 0)
         # if self.re.ie.ieExpander.get_expanded():
         #    itr = self.get_selected_ing()
         #    if itr:
@@ -2210,37 +2819,38 @@ class IngredientTreeUI:
         if isinstance(obj, str) and obj.find("GROUP") == 0:
             print('Sorry, whole groups cannot be toggled to "optional"')
             return
-        newval = not val
         ref = self.ingController.get_persistent_ref_from_iter(iterator)
-        u = Undo.UndoableObject(
-            lambda *args: store.set_value(self.ingController.get_iter_from_persistent_ref(ref), colnum, newval),
-            lambda *args: store.set_value(self.ingController.get_iter_from_persistent_ref(ref), colnum, val),
+        set_value = self.ingController.set_value_for_ref
+        Undo.UndoableObject(
+            set_value,
+            set_value,
             self.ingredient_editor_module.history,
+            action_args=[ref, colnum, not val],
+            undo_action_args=[ref, colnum, val],
             widget=self.ingController.imodel,
-        )
-        u.perform()
+        ).perform()
 
     def ingtree_start_keyedit_cb(self, renderer, cbe, path_string):
         debug("ingtree_start_keyedit_cb", 0)
-        indices = path_string.split(":")
-        path = tuple(map(int, indices))
+        path = Gtk.TreePath.new_from_string(path_string)
         store = self.ingTree.get_model()
         iter = store.get_iter(path)
         itm = store.get_value(iter, self.ingColsByAttr["item"])
         mod = renderer.get_property("model")
         myfilter = mod.filter_new()
         cbe.set_model(myfilter)
-        myKeys = self.rg.rd.key_search(itm)
+        # A set, since vis() checks it for every row in the completion model.
+        myKeys = frozenset(self.rg.rd.key_search(itm) or ())
 
         def vis(m, iter):
-            return m.get_value(iter, 0) and (m.get_value(iter, 0) in myKeys or m.get_value(iter, 0).find(itm) > -1)
+            val = m.get_value(iter, 0)
+            return bool(val) and (val in myKeys or itm in val)
 
         myfilter.set_visible_func(vis)
         myfilter.refilter()
 
-    def ingtree_edited_cb(self, renderer, path_string, text, colnum, head):
-        indices = path_string.split(":")
-        path = tuple(map(int, indices))
+    def ingtree_edited_cb(self, renderer, path_string, text, colnum, attr):
+        path = Gtk.TreePath.new_from_string(path_string)
         store = self.ingTree.get_model()
         iter = store.get_iter(path)
         ing = store.get_value(iter, 0)
@@ -2250,7 +2860,6 @@ class IngredientTreeUI:
             self.change_group(iter, text)
             return
         else:
-            attr = self.head_to_att[head]
             d[attr] = text
             if attr == "amount":
                 try:
@@ -2266,8 +2875,8 @@ class IngredientTreeUI:
                 #    self.re.message(msg)
             elif attr == "item":
                 d["ingkey"] = self.rg.rd.km.get_key(text)
-            ref = self.ingController.get_persistent_ref_from_iter(iter)
-            self.ingController.undoable_update_ingredient_row(ref, d)
+            # Column 0, which we already have, is the row's persistent ref.
+            self.ingController.undoable_update_ingredient_row(ing, d)
 
     # Drag-n-Drop Callbacks
 
@@ -2277,6 +2886,7 @@ class IngredientTreeUI:
             % (self, widget, context, x, y, selection, targetType, time),
             3,
         )
+        self.ingController.finish_loading()
         drop_info = self.ingTree.get_dest_row_at_pos(x, y)
         mod = self.ingTree.get_model()
 
@@ -2309,34 +2919,25 @@ class IngredientTreeUI:
                 uts.record_positions(self.selected_iters)
                 selected_iters = reversed(self.selected_iters)
 
-                if group and (position == Gtk.TreeViewDropPosition.INTO_OR_BEFORE or position == Gtk.TreeViewDropPosition.INTO_OR_AFTER):
-                    for i in selected_iters:
-                        te.move_iter(mod, i, direction="before", parent=diter)
-
-                elif position == Gtk.TreeViewDropPosition.INTO_OR_BEFORE or position == Gtk.TreeViewDropPosition.BEFORE:  # Moving up from anywhere but bottom
-                    for i in selected_iters:
-                        te.move_iter(mod, i, sibling=diter, direction="before")
-
-                elif position == Gtk.TreeViewDropPosition.AFTER:  # Moving from the bottom up
-                    for i in selected_iters:
-                        te.move_iter(mod, i, sibling=diter, direction="after")
-                else:  # position == None, pushed below the last item
-                    diter = te.get_last(mod)
-                    for i in selected_iters:
-                        te.move_iter(mod, i, sibling=diter, direction="after")
-
-                debug("do_move - inside dragIngsRecCB - move selections", 3)
-                self.ingTree.get_selection().unselect_all()
-                for r in selected_iter_refs:
-                    i = self.ingController.get_iter_from_persistent_ref(r)
-                    if not i:
-                        print("Odd - I get no iter for ref", r)
-                        import traceback
-
-                        traceback.print_stack()
-                        print("Strange indeed! carry on...")
-                    else:
-                        self.ingTree.get_selection().select_iter(i)
+                # The moved rows are selected again once the model is back
+                # in the view.
+                with self.ingController._bulk_update(select=selected_iter_refs):
+                    if group and (position == Gtk.TreeViewDropPosition.INTO_OR_BEFORE or position == Gtk.TreeViewDropPosition.INTO_OR_AFTER):
+                        for i in selected_iters:
+                            te.move_iter(mod, i, direction="before", parent=diter)
+
+                    # Moving up from anywhere but bottom
+                    elif position == Gtk.TreeViewDropPosition.INTO_OR_BEFORE or position == Gtk.TreeViewDropPosition.BEFORE:
+                        for i in selected_iters:
+                            te.move_iter(mod, i, sibling=diter, direction="before")
+
+                    elif position == Gtk.TreeViewDropPosition.AFTER:  # Moving from the bottom up
+                        for i in selected_iters:
+                            te.move_iter(mod, i, sibling=diter, direction="after")
+                    else:  # position == None, pushed below the last item
+                        diter = te.get_last(mod)
+                        for i in selected_iters:
+                            te.move_iter(mod, i, sibling=diter, direction="after")
                 debug("do_move - inside dragIngsRecCB - DONE", 3)
 
             Undo.UndoableObject(do_move, uts.restore_positions, self.ingredient_editor_module.history, widget=self.ingController.imodel).perform()
@@ -2369,19 +2970,12 @@ class IngredientTreeUI:
     def dragIngsGetCB(self, tv: Gtk.TreeView, context: Any, selection: Gtk.SelectionData, info: int, timestamp: int):
         def grab_selection(model, path, iter, args):
             strings, iters = args
-            str = ""
-            amt = model.get_value(iter, 1)
-            if amt:
-                str = "%s " % amt
-            unit = model.get_value(iter, 2)
-            if unit:
-                str = "%s%s " % (str, unit)
-            item = model.get_value(iter, 3)
-            if item:
-                str = "%s%s" % (str, item)
-            debug("Dragged string: %s, iter: %s" % (str, iter), 3)
+            # amount, unit and item, leaving out whichever are empty
+            line = " ".join(str(v) for v in model.get(iter, 1, 2, 3) if v)
+            if debug_level >= 3:
+                debug("Dragged string: %s, iter: %s" % (line, iter), 3)
             iters.append(iter)
-            strings.append(str)
+            strings.append(line)
 
         strings = []
         iters = []
@@ -2391,8 +2985,11 @@ class IngredientTreeUI:
     # Move-item callbacks
 
     def get_selected_refs(self):
-        ts, paths = self.ingTree.get_selection().get_selected_rows()
-        return [self.ingController.get_persistent_ref_from_path(p) for p in paths]
+        # Read the refs straight off the selected rows, rather than
+        # turning each selected path back into an iter first.
+        refs = []
+        self.ingTree.get_selection().selected_foreach(lambda model, path, itr: refs.append(model.get_value(itr, 0)))
+        return refs
 
     def ingUpCB(self, *args):
         refs = self.get_selected_refs()
@@ -2414,6 +3011,7 @@ class IngredientTreeUI:
         u.perform()
 
     def ingUpMover(self, paths):
+        self.ingController.finish_loading()
         ts = self.ingController.imodel
 
         def moveup(ts, path, itera):
@@ -2432,6 +3030,7 @@ class IngredientTreeUI:
         tt.restore_selections()
 
     def ingDownMover(self, paths):
+        self.ingController.finish_loading()
         ts = self.ingController.imodel
 
         def movedown(ts, path, itera):
@@ -2522,24 +3121,25 @@ class IngredientTreeUI:
 
     # Accessing the selection
 
+    def _selected_iters(self) -> List[Gtk.TreeIter]:
+        """Return iters for the selected rows, in tree order."""
+        iters = []
+        self.ingTree.get_selection().selected_foreach(lambda model, path, itr: iters.append(itr.copy()))
+        return iters
+
     def getSelectedIters(self):
-        if len(self.ingController.imodel) == 0:
+        # Counting the rows of a TreeStore walks them; we only need to
+        # know whether there is one.
+        if self.ingController.imodel.get_iter_first() is None:
             return None
-        ts, paths = self.ingTree.get_selection().get_selected_rows()
-        return [ts.get_iter(p) for p in paths]
+        return self._selected_iters()
 
     def getSelectedIter(self):
         debug("getSelectedIter", 4)
-        if len(self.ingController.imodel) == 0:
+        if self.ingController.imodel.get_iter_first() is None:
             return None
-        try:
-            ts, paths = self.ingTree.get_selection().get_selected_rows()
-            lpath = paths[-1]
-            group = ts.get_iter(lpath)
-        except Exception:
-            debug("getSelectedIter: there was an exception", 0)
-            group = None
-        return group
+        iters = self._selected_iters()
+        return iters[-1] if iters else None
 
     def get_selected_ing(self):
         """get selected ingredient"""
@@ -2548,11 +3148,8 @@ class IngredientTreeUI:
         if path:
             itera = self.ingTree.get_model().get_iter(path)
         else:
-            tv, rows = self.ingTree.get_selection().get_selected_rows()
-            if len(rows) > 0:
-                itera = rows[0]
-            else:
-                itera = None
+            iters = self._selected_iters()
+            itera = iters[0] if iters else None
         return itera
         # if itera:
         #    return self.ingTree.get_model().get_value(itera,0)
@@ -2600,9 +3197,7 @@ class IngredientTreeUI:
 
     def change_group(self, itr, text):
         debug("Undoable group change: %s %s" % (itr, text), 3)
-        model = self.ingController.imodel
-        oldgroup0 = model.get_value(itr, 0)
-        oldgroup1 = model.get_value(itr, 1)
+        oldgroup1 = self.ingController.imodel.get_value(itr, 1)
 
         def get_group_iter(old_value):
             # Somewhat hacky -- our persistent references are stored in
@@ -2615,14 +3210,10 @@ class IngredientTreeUI:
             return self.ingController.get_iter_from_persistent_ref("GROUP %s" % old_value)
 
         def change_my_group():
-            itr = get_group_iter(oldgroup1)
-            self.ingController.imodel.set_value(itr, 0, "GROUP %s" % text)
-            self.ingController.imodel.set_value(itr, 1, text)
+            self.ingController.rename_group(get_group_iter(oldgroup1), text)
 
         def unchange_my_group():
-            itr = get_group_iter(text)
-            self.ingController.imodel.set_value(itr, 0, oldgroup0)
-            self.ingController.imodel.set_value(itr, 1, oldgroup1)
+            self.ingController.rename_group(get_group_iter(text), oldgroup1)
 
         obj = Undo.UndoableObject(change_my_group, unchange_my_group, self.ingredient_editor_module.history)
         obj.perform()
@@ -2634,6 +3225,9 @@ class UndoableTreeStuff:
 
     def start_recording_additions(self):
         debug("UndoableTreeStuff.start_recording_additiong", 3)
+        # Rows still waiting to be loaded are not additions; get them in
+        # before we start listening, or undoing would delete them.
+        self.ic.finish_loading()
         self.added = []
         self.pre_ss = te.selectionSaver(self.ic.ingredient_editor_module.ingtree_ui.ingTree)
         self.connection = self.ic.imodel.connect("row-inserted", self.row_inserted_cb)
@@ -2641,12 +3235,8 @@ class UndoableTreeStuff:
 
     def stop_recording_additions(self):
         debug("UndoableTreeStuff.stop_recording_additiong", 3)
-        self.added = [
-            # i.get_model().get_iter(i.get_path()) is how we get an
-            # iter from a TreeRowReference
-            self.ic.get_persistent_ref_from_iter(i.get_model().get_iter(i.get_path()))
-            for i in self.added
-        ]
+        get_ref = self.ic.get_persistent_ref_from_path
+        self.added = [get_ref(rowref.get_path()) for rowref in self.added]
         self.ic.imodel.disconnect(self.connection)
         debug("UndoableTreeStuff.stop_recording_additions DONE", 3)
 
@@ -2656,28 +3246,36 @@ class UndoableTreeStuff:
         debug("UndoableTreeStuff.undo_recorded_additions DONE", 3)
 
     def row_inserted_cb(self, tm, path, itr):
-        self.added.append(Gtk.TreeRowReference(tm, tm.get_path(itr)))
+        # Our persistent ref is not in the row yet (insert_after and
+        # friends fill it in after this signal), and a bare path would
+        # go stale as soon as the next row lands in front of it -- an
+        # external drop inserts every line at the same spot -- so we
+        # let a TreeRowReference follow the row until we stop recording.
+        self.added.append(Gtk.TreeRowReference.new(tm, path))
 
     def record_positions(self, iters):
         debug("UndoableTreeStuff.record_positions", 3)
         self.pre_ss = te.selectionSaver(self.ic.ingredient_editor_module.ingtree_ui.ingTree)
         self.positions = []
+        get_ref = self.ic.get_persistent_ref_from_path
         for i in iters:
-            path = self.ic.imodel.get_path(i)
+            # Indexing a TreePath fetches all of its indices each time, so
+            # get them once.
+            path = self.ic.imodel.get_path(i).get_indices()
             if path[-1] == 0:
-                parent = path[:-1] or None
-                sibling = None
+                # A first child is put back by its parent, if it has one.
+                sib_ref = None
+                parent_ref = get_ref(path[:-1]) if len(path) > 1 else None
             else:
-                parent = None
-                sibling = path[:-1] + [path[-1] - 1]
-            sib_ref = sibling and self.ic.get_persistent_ref_from_path(sibling)
-            parent_ref = parent and self.ic.get_persistent_ref_from_path(parent)
+                sib_ref = get_ref(path[:-1] + [path[-1] - 1])
+                parent_ref = None
             ref = self.ic.get_persistent_ref_from_iter(i)
             self.positions.append((ref, sib_ref, parent_ref))
         debug("UndoableTreeStuff.record_positions DONE", 3)
 
     def restore_positions(self):
         debug("UndoableTreeStuff.restore_positions", 3)
+        self.ic.finish_loading()
         for ref, sib_ref, parent_ref in self.positions:
             te.move_iter(
                 self.ic.imodel,
@@ -2737,43 +3335,71 @@ class IngInfo:
         self.item_connect_calls = []
         self.manually = False
 
+    item_batch_size = 500
+    _item_idle_id = 0
+
     def make_item_model(self):
         # unique_item_vw = self.rd.ingredients_table_not_deleted.counts(self.rd.ingredients_table_not_deleted.item, 'count')
+        # The item model is filled on idle (see below), after
+        # connect_models() has already handed it to the completions and
+        # combos. That is fine: the model is never sorted, so there is no
+        # sorting to hold off, and completion works with a partial list.
+        if self._item_idle_id:
+            GLib.source_remove(self._item_idle_id)
         self.item_model = Gtk.ListStore(str)
-        for i in self.rd.get_unique_values("item", table=self.rd.ingredients_table, deleted=False):
-            self.item_model.append([i])
-        if len(self.item_model) == 0:
+        items = self.rd.get_unique_values("item", table=self.rd.ingredients_table, deleted=False)
+        if not items:
             from .defaults import defaults
 
-            for i, k, c in defaults.lang.INGREDIENT_DATA:
-                self.item_model.append([i])
+            items = [i for i, k, c in defaults.lang.INGREDIENT_DATA]
+        # A large database has a great many items, so we fill the model
+        # in a batch at a time while idle rather than holding up startup.
+        self._items = iter(items)
+        self._item_idle_id = GLib.idle_add(self._add_item_batch, priority=GLib.PRIORITY_LOW)
+
+    def _add_item_batch(self) -> bool:
+        """Add up to item_batch_size more items, returning True while any are left."""
+        append = self.item_model.append
+        n = 0
+        for n, i in enumerate(islice(self._items, self.item_batch_size), 1):
+            append((i,))
+        if n < self.item_batch_size:
+            self._items = None
+            self._item_idle_id = 0
+            return False
+        return True
 
     def make_key_model(self, myShopCategory):
         # make up the model for the combo box for the ingredient keys
         if myShopCategory:
-            unique_key_vw = self.rd.get_unique_values("ingkey", table=self.rd.shopcats_table, shopcategory=myShopCategory)
+            unique_key_vw = self.rd.get_unique_values("ingkey", table=self.rd.shopcats_table, sort=True, shopcategory=myShopCategory)
         else:
             # unique_key_vw = self.rd.get_unique_values('ingkey',table=self.rd.keylookup_table)
-            unique_key_vw = self.rd.get_unique_values("ingkey", table=self.rd.ingredients_table)
+            unique_key_vw = self.rd.get_unique_values("ingkey", table=self.rd.ingredients_table, sort=True)
         # the key model by default stores a string and a list.
         self.key_model = Gtk.ListStore(str)
-        keys = []
+        append = self.key_model.append
         for k in unique_key_vw:
-            keys.append(k)
+            append((k,))
+        self._key_rows = None  # built by change_key when first needed
 
-        keys.sort()
-        for k in keys:
-            self.key_model.append([k])
+    def _get_key_rows(self) -> Dict[str, Gtk.TreeRowReference]:
+        """Return a dictionary of key -> reference to its key_model row."""
+        if self._key_rows is None:
+            self._key_rows = {row[0]: Gtk.TreeRowReference.new(self.key_model, row.path) for row in self.key_model}
+        return self._key_rows
 
     def change_key(self, old_key, new_key):
         """One of our keys has changed."""
-        keys = [x[0] for x in self.key_model]
-        index = keys.index(old_key)
-        if old_key in keys:
-            if new_key in keys:
-                del self.key_model[index]
+        key_rows = self._get_key_rows()
+        rowref = key_rows.pop(old_key, None)
+        if rowref is not None and rowref.valid():
+            itr = self.key_model.get_iter(rowref.get_path())
+            if new_key in key_rows:
+                self.key_model.remove(itr)
             else:
-                self.key_model[index] = [new_key]
+                self.key_model.set_value(itr, 0, new_key)
+                key_rows[new_key] = rowref
         modindx = self.rd.normalizations["ingkey"].find(old_key)
         if modindx >= 0:
             self.rd.normalizations["ingkey"][modindx].ingkey = new_key
@@ -2804,7 +3430,7 @@ class RecSelector(RecIndex):
     def __init__(self, recGui, ingEditor):
         self.prefs = prefs.Prefs.instance()
         self.ui = Gtk.Builder()
-        self.ui.add_from_string(get_data("gourmand", "ui/recipe_index.ui").decode())
+        self.ui.add_from_string(_load_ui_xml("recipe_index.ui"))
         self.rg = recGui
         self.ingEditor = ingEditor
         self.re = self.ingEditor.re
@@ -2862,8 +3488,12 @@ class RecSelector(RecIndex):
 
     def ok(self, *args):
         debug("ok", 0)
+        ic = self.ingEditor.ingtree_ui.ingController
         pre_iter = self.ingEditor.ingtree_ui.get_selected_ing()
+        # Held by ref, since a redo may come after the tree has changed.
+        pre_ref = ic.get_persistent_ref_from_iter(pre_iter) if pre_iter else None
         try:
+            ingdics = []
             for rec in self.get_selected_recs_from_rec_tree():
                 if rec.id == self.re.current_rec.id:
                     de.show_message(label=_("Recipe cannot call itself as an ingredient!"), sublabel=_("Infinite recursion is not allowed in recipes!"))
@@ -2878,7 +3508,19 @@ class RecSelector(RecIndex):
                     "refid": rec.id,
                 }
                 debug("adding ing: %s" % ingdic, 5)
-                self.ingEditor.ingtree_ui.ingController.add_ingredient_from_kwargs(group_iter=pre_iter, **ingdic)
+                ingdics.append(ingdic)
+            if ingdics:
+                # Add all the recipes at once, with the view detached, as
+                # a single step in our history.
+                def do_add():
+                    # add_with_undo has already finished loading the
+                    # recipe's own rows, so only ours get recorded.
+                    with ic._bulk_update():
+                        group_iter = ic.get_iter_from_persistent_ref(pre_ref)
+                        for ingdic in ingdics:
+                            ic.add_ingredient_from_kwargs(group_iter=group_iter, **ingdic)
+
+                add_with_undo(self.ingEditor, do_add)
             self.quit()
         except:
             de.show_message(label=_("You haven't selected any recipes!"))
@@ -2898,7 +3540,6 @@ class YieldSelector(de.ModalDialog):
         self.recButton, self.recAdj = create_spinner(val=1, lower=0, step_incr=0.5, page_incr=5)
         recLabel = Gtk.Label(label=_("Recipes") + ": ")
         self.recAdj.connect("value_changed", self.update_from_rec)
-        self.recAdj.connect("changed", self.update_from_rec)
         table.attach(recLabel, 0, 1, 0, 1)
         recLabel.show()
         table.attach(self.recButton, 1, 2, 0, 1)
@@ -2906,7 +3547,6 @@ class YieldSelector(de.ModalDialog):
         if rec.yields:
             self.yieldsButton, self.yieldsAdj = create_spinner(self.rec.yields)
             self.yieldsAdj.connect("value_changed", self.update_from_yield)
-            self.yieldsAdj.connect("changed", self.update_from_yield)
             yieldsLabel = Gtk.Label(label=rec.yield_unit.title() + ": ")
             table.attach(yieldsLabel, 0, 1, 1, 2)
             yieldsLabel.show()
@@ -2917,12 +3557,12 @@ class YieldSelector(de.ModalDialog):
     def update_from_yield(self, *args):
         if self.__in_update_from_rec:
             return
-        self._in_update_from_yield = True
+        self.__in_update_from_yield = True
         yield_val = self.yieldsAdj.get_value()
         factor = yield_val / float(self.rec.yields)
         self.recAdj.set_value(factor)
         self.ret = factor
-        self._in_update_from_yield = False
+        self.__in_update_from_yield = False
 
     def update_from_rec(self, *args):
         if self.__in_update_from_yield:
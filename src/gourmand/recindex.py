@@ -695,6 +695,12 @@ class RecipeModel(pageable_store.PageableViewStore):
             else:
                 return None
 
+    def has_recipe(self, recipe) -> bool:
+        """Handed a recipe (or a recipe ID), return whether it is among our search results."""
+        if not isinstance(recipe, int):
+            recipe = recipe.id
+        return any(row.id == recipe for row in self.parent_list)
+
     def update_recipe(self, recipe):
         """Handed a recipe (or a recipe ID), we update its display if visible."""
         debug("Updating recipe %s" % recipe.title, 3)
@@ -75,6 +75,8 @@ class TestIngBasics(DBTest):
             self.db.add_ing({"amount": 1, "unit": "c.", "item": i, "ingkey": i})
         vv = self.db.get_unique_values("ingkey", self.db.ingredients_table)
         assert len(vv) == 3
+        vv = self.db.get_unique_values("ingkey", self.db.ingredients_table, sort=True)
+        assert vv == ["broccoli", "juice, tomato", "spinach"]
         cvw = self.db.fetch_count(self.db.ingredients_table, "ingkey", ingkey="spinach", sort_by=[("count", -1)])
         assert cvw[0].count == 3
         assert cvw[0].ingkey == "spinach"
@@ -241,6 +243,22 @@ class TestMoreDataStuff(DBTest):
             # Change back our ingredient...
             r = self.db.modify_ing(i, {attr: orig_attrs[attr]})
 
+    def test_modify_ings_and_update_keydic(self):
+        self.db.delete_by_criteria(self.db.keylookup_table, {"ingkey": "baz"})  # Clear out earlier runs
+        r = self.db.add_rec({"title": "itest"})
+        i1 = self.db.add_ing({"item": "Foo", "ingkey": "foo", "amount": 1, "recipe_id": r.id})
+        i2 = self.db.add_ing({"item": "Bar", "ingkey": "bar", "amount": 2, "recipe_id": r.id})
+        i3 = self.db.add_ing_and_update_keydic({"item": "Baz", "ingkey": "baz", "amount": 3, "recipe_id": r.id})
+        self.assertEqual(self.db.fetch_one(self.db.keylookup_table, item="Baz", ingkey="baz").count, 1)
+        self.db.modify_ings_and_update_keydic([(i1, {"amount": 4}), (i2, {"amount": 5}), (i3, {"item": "Boz", "unit": "cup"})])
+        self.assertEqual(self.db.fetch_one(self.db.ingredients_table, id=i1.id).amount, 4)
+        self.assertEqual(self.db.fetch_one(self.db.ingredients_table, id=i2.id).amount, 5)
+        i3 = self.db.fetch_one(self.db.ingredients_table, id=i3.id)
+        self.assertEqual((i3.item, i3.unit, i3.amount), ("Boz", "cup", 3))
+        # The key dictionary follows the renamed item.
+        self.assertIsNone(self.db.fetch_one(self.db.keylookup_table, item="Baz", ingkey="baz"))
+        self.assertEqual(self.db.fetch_one(self.db.keylookup_table, item="Boz", ingkey="baz").count, 1)
+
 
 def test_format_amount_string_from_amount():
     ret = db.RecData.format_amount_string_from_amount((0.5, 1))
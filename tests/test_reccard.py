@@ -1,10 +1,11 @@
+import xml.sax.saxutils
 from unittest import mock
 from unittest.mock import Mock
 
 import gi
 
 from gourmand.main import get_application
-from gourmand.reccard import RecCard, RecCardDisplay, add_with_undo
+from gourmand.reccard import RecCard, RecCardDisplay, _escape, add_with_undo
 
 gi.require_version("Gtk", "3.0")
 
@@ -164,6 +165,26 @@ def do_ingredients_undo(rc):
     print_("Deletion revert worked!")
 
 
+def do_ingredients_save_twice(rc):
+    """Setting a value back to what it was at load must still be saved."""
+    # Show the ingredients tab
+    mock_button = Mock()
+    mock_button.get_name = Mock(return_value="ingredients")
+    rc.show_edit(mock_button)
+
+    (ref,) = add_save_and_check(rc, [["1 c. flour", None, {"amount": 1, "unit": "c.", "item": "flour"}]])
+
+    idx = rc._RecCard__rec_editor.module_tab_by_name["ingredients"]
+    ing_controller = rc._RecCard__rec_editor.modules[idx].ingtree_ui.ingController
+
+    for amount in (2, 1):
+        ing_controller.update_ingredient_row(ing_controller.get_iter_from_persistent_ref(ref), amount=amount)
+        rc._RecCard__rec_editor.save_cb(None)
+        ings = rc._RecCard__rec_gui.rd.get_ings(rc.current_rec)
+        check_ings([{"item": "flour", "amount": amount}], ings)
+    print_("Saving the same ingredient twice worked.")
+
+
 def do_ingredients_group_editing(rc):
     # Show the ingredients tab
     mock_button = Mock()
@@ -293,7 +314,14 @@ def test_reccard(tmp_path):
         print("Ingredient Editing test passed!")
         do_ingredients_undo(rec_card)
         print("Ingredient Revert test passed!")
+        do_ingredients_save_twice(rec_card)
+        print("Saving twice test passed!")
         # do_undo_save_sensitivity(rec_card)
         print("Undo properly sensitizes save widget.")
         do_ingredients_group_editing(rec_card)
         print("Ing Group Editing works.")
+
+
+def test_escape():
+    for text in ["", "Salt & pepper", "<b>bold</b>", "a > b < c", "&amp; already escaped"]:
+        assert _escape(text) == xml.sax.saxutils.escape(text)